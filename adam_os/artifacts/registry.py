@@ -14,16 +14,24 @@ Rules:
 from __future__ import annotations
 
 import hashlib
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from adam_os.memory.canonical import canonical_dumps
 from adam_os.artifacts.records import ArtifactRecord
 
 
+# Serializes in-process appends (pipelined runners write from several threads).
+_APPEND_LOCK = threading.Lock()
+
+
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
+        # Python 3.11+: file_digest reads in large chunks straight into OpenSSL.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
@@ -47,12 +55,29 @@ class ArtifactRegistry:
         self.ensure_dirs()
 
         line = canonical_dumps(record.to_dict())
-        with self.registry_path.open("a", encoding="utf-8") as f:
-            f.write(line)
-            f.write("\n")
+        with _APPEND_LOCK, self.registry_path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
         return record.to_dict()
 
-    def append_from_file(
+    def append_many(self, records: Sequence[ArtifactRecord]) -> List[Dict[str, Any]]:
+        """Append several records with a single write.
+
+        All records are validated before anything is written, so a bad record
+        leaves the registry untouched.
+        """
+        for record in records:
+            record.validate()
+        if not records:
+            return []
+        self.ensure_dirs()
+
+        out = [record.to_dict() for record in records]
+        payload = "".join(canonical_dumps(d) + "\n" for d in out)
+        with _APPEND_LOCK, self.registry_path.open("a", encoding="utf-8") as f:
+            f.write(payload)
+        return out
+
+    def record_from_file(
         self,
         *,
         artifact_id: str,
@@ -63,14 +88,14 @@ class ArtifactRegistry:
         parent_artifact_ids: Optional[list[str]] = None,
         notes: Optional[str] = None,
         tags: Optional[list[str]] = None,
-    ) -> Dict[str, Any]:
+    ) -> ArtifactRecord:
         if parent_artifact_ids is None:
             parent_artifact_ids = []
 
         sha = sha256_file(file_path)
         size = file_size_bytes(file_path)
 
-        rec = ArtifactRecord(
+        return ArtifactRecord(
             artifact_id=artifact_id,
             kind=kind,
             created_at_utc=created_at_utc,
@@ -81,4 +106,27 @@ class ArtifactRegistry:
             notes=notes,
             tags=tags,
         )
+
+    def append_from_file(
+        self,
+        *,
+        artifact_id: str,
+        kind: str,
+        created_at_utc: str,
+        file_path: Path,
+        media_type: str,
+        parent_artifact_ids: Optional[list[str]] = None,
+        notes: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+    ) -> Dict[str, Any]:
+        rec = self.record_from_file(
+            artifact_id=artifact_id,
+            kind=kind,
+            created_at_utc=created_at_utc,
+            file_path=file_path,
+            media_type=media_type,
+            parent_artifact_ids=parent_artifact_ids,
+            notes=notes,
+            tags=tags,
+        )
         return self.append(rec)
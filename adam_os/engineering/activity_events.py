@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Dict, Optional
 
-from adam_os.tools.engineering_log_append import append_engineering_event
+from adam_os.tools.engineering_log_append import DEFAULT_ACTIVITY_LOG_PATH, append_engineering_event
+
+
+def activity_log_path(artifact_root: Path) -> Path:
+    """Activity log that sits beside an artifact root (<root>/.adam_os/engineering/...)."""
+    return Path(artifact_root).parent / "engineering" / DEFAULT_ACTIVITY_LOG_PATH.name
 
 
 def log_tool_execution(
@@ -14,6 +20,7 @@ def log_tool_execution(
     artifact_id: Optional[str] = None,
     error_id: Optional[str] = None,
     extra: Optional[Dict[str, Any]] = None,
+    log_path: Path = DEFAULT_ACTIVITY_LOG_PATH,
 ) -> str:
     event: Dict[str, Any] = {
         "created_at_utc": created_at_utc,
@@ -33,4 +40,4 @@ def log_tool_execution(
         for k, v in extra.items():
             event[k] = v
 
-    return append_engineering_event(event)
+    return append_engineering_event(event, log_path=log_path)
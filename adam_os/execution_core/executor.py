@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Protocol
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol
 
 from adam_os.execution_core.errors import ToolNotFoundError, ToolExecutionError
 from adam_os.tools import registry as tool_registry
@@ -98,23 +99,52 @@ def _ensure_tools_registered() -> None:
         tool_registry.register(INFERENCE_EXECUTE_TOOL_NAME, inference_execute)
 
 
+def _resolve_tool(tool_name: str) -> tool_registry.ToolFn:
+    name = (tool_name or "").strip()
+    if not name:
+        raise ToolNotFoundError("empty tool name")
+
+    if not tool_registry.has(name):
+        raise ToolNotFoundError(f"Tool not wired: {name}")
+
+    return tool_registry.get(name)
+
+
+def _call_tool(fn: tool_registry.ToolFn, tool_input: Dict[str, Any]) -> Any:
+    try:
+        return fn(tool_input)
+    except ToolNotFoundError:
+        raise
+    except Exception as e:
+        raise ToolExecutionError(str(e)) from e
+
+
 @dataclass
 class LocalExecutor:
     def __post_init__(self) -> None:
         _ensure_tools_registered()
 
     def execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
-        name = (tool_name or "").strip()
-        if not name:
-            raise ToolNotFoundError("empty tool name")
-
-        if not tool_registry.has(name):
-            raise ToolNotFoundError(f"Tool not wired: {name}")
-
-        fn = tool_registry.get(name)
-        try:
-            return fn(tool_input)
-        except ToolNotFoundError:
-            raise
-        except Exception as e:
-            raise ToolExecutionError(str(e)) from e
+        return _call_tool(_resolve_tool(tool_name), tool_input)
+
+    def bind(self, tool_names: Iterable[str]) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+        """Resolve tool names once; each handler(tool_input) behaves like execute_tool(name, tool_input).
+
+        Unknown names fail here, at bind time, rather than on first call.
+        """
+        return {name: partial(_call_tool, _resolve_tool(name)) for name in tool_names}
+
+
+_SINGLETON: Optional[LocalExecutor] = None
+
+
+def get_executor() -> LocalExecutor:
+    """Process-wide LocalExecutor, built on first use.
+
+    Runner scripts imported into one driver process share it instead of each
+    constructing (and re-running tool registration for) their own.
+    """
+    global _SINGLETON
+    if _SINGLETON is None:
+        _SINGLETON = LocalExecutor()
+    return _SINGLETON
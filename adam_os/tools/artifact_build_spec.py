@@ -44,7 +44,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from adam_os.artifacts.registry import ArtifactRegistry, sha256_file, file_size_bytes
-from adam_os.engineering.activity_events import log_tool_execution
+from adam_os.engineering.activity_events import activity_log_path, log_tool_execution
 from adam_os.memory.canonical import canonical_dumps, sha256_hex
 
 
@@ -139,7 +139,7 @@ def _frozen_prompt_template() -> Dict[str, Any]:
     }
 
 
-def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+def artifact_build_spec(tool_input: Dict[str, Any], *, artifact_root: Path = ARTIFACT_ROOT) -> Dict[str, Any]:
     if not isinstance(tool_input, dict):
         raise TypeError("tool_input must be dict")
 
@@ -147,6 +147,11 @@ def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(created_at_utc, str) or not created_at_utc.strip():
         raise ValueError("tool_input.created_at_utc must be a non-empty injected string")
 
+    artifact_root = Path(artifact_root)
+    bundles_dir = artifact_root / "bundles"
+    specs_dir = artifact_root / "specs"
+    log_path = activity_log_path(artifact_root)
+
     try:
         media_type = tool_input.get("media_type") or DEFAULT_MEDIA_TYPE
         if not isinstance(media_type, str) or not media_type.strip():
@@ -177,10 +182,10 @@ def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         if inferred_notes is not None and not isinstance(inferred_notes, str):
             raise ValueError("tool_input.inferred_notes must be a string if provided")
 
-        SPECS_DIR.mkdir(parents=True, exist_ok=True)
-        spec_path = SPECS_DIR / f"{spec_id}.json"
+        specs_dir.mkdir(parents=True, exist_ok=True)
+        spec_path = specs_dir / f"{spec_id}.json"
 
-        reg = ArtifactRegistry(artifact_root=ARTIFACT_ROOT)
+        reg = ArtifactRegistry(artifact_root=artifact_root)
 
         # Idempotency gate (no duplicate registry append)
         if spec_path.exists() and _registry_has(reg.registry_path, spec_id, "BUILD_SPEC"):
@@ -196,6 +201,7 @@ def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
 
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="idempotent",
                 artifact_id=spec_id,
@@ -218,7 +224,7 @@ def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
                 "bundle_hash": bundle_hash,
             }
 
-        bundle_path = BUNDLES_DIR / f"{bundle_id}.json"
+        bundle_path = bundles_dir / f"{bundle_id}.json"
         bundle_obj = _read_bundle_manifest(bundle_path)
         bundle_hash = bundle_obj["bundle_hash"]
         members = bundle_obj["members"]
@@ -301,6 +307,7 @@ def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
 
         log_tool_execution(
             created_at_utc=created_at_utc,
+            log_path=log_path,
             tool_name=TOOL_NAME,
             status="success",
             artifact_id=spec_id,
@@ -329,6 +336,7 @@ def artifact_build_spec(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             artifact_id = locals().get("spec_id")
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="error",
                 artifact_id=artifact_id if isinstance(artifact_id, str) else None,
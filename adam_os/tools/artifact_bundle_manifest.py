@@ -41,7 +41,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from adam_os.artifacts.registry import ArtifactRegistry, sha256_file, file_size_bytes
-from adam_os.engineering.activity_events import log_tool_execution
+from adam_os.engineering.activity_events import activity_log_path, log_tool_execution
 from adam_os.memory.canonical import canonical_dumps
 
 
@@ -160,7 +160,7 @@ def _sha256_text(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
-def artifact_bundle_manifest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+def artifact_bundle_manifest(tool_input: Dict[str, Any], *, artifact_root: Path = ARTIFACT_ROOT) -> Dict[str, Any]:
     if not isinstance(tool_input, dict):
         raise TypeError("tool_input must be dict")
 
@@ -168,6 +168,10 @@ def artifact_bundle_manifest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(created_at_utc, str) or not created_at_utc.strip():
         raise ValueError("tool_input.created_at_utc must be a non-empty injected string")
 
+    artifact_root = Path(artifact_root)
+    bundles_dir = artifact_root / "bundles"
+    log_path = activity_log_path(artifact_root)
+
     try:
         media_type = tool_input.get("media_type") or DEFAULT_MEDIA_TYPE
         if not isinstance(media_type, str) or not media_type.strip():
@@ -183,10 +187,10 @@ def artifact_bundle_manifest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("tool_input.bundle_artifact_id must be a non-empty string if provided")
         bundle_id = bundle_artifact_id.strip()
 
-        BUNDLES_DIR.mkdir(parents=True, exist_ok=True)
-        bundle_path = BUNDLES_DIR / f"{bundle_id}.json"
+        bundles_dir.mkdir(parents=True, exist_ok=True)
+        bundle_path = bundles_dir / f"{bundle_id}.json"
 
-        reg = ArtifactRegistry(artifact_root=ARTIFACT_ROOT)
+        reg = ArtifactRegistry(artifact_root=artifact_root)
 
         # Idempotency gate (no duplicate registry append)
         if bundle_path.exists() and _registry_has(reg.registry_path, bundle_id, "BUNDLE_MANIFEST"):
@@ -211,6 +215,7 @@ def artifact_bundle_manifest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             }
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="idempotent",
                 artifact_id=bundle_id,
@@ -270,6 +275,7 @@ def artifact_bundle_manifest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         }
         log_tool_execution(
             created_at_utc=created_at_utc,
+            log_path=log_path,
             tool_name=TOOL_NAME,
             status="success",
             artifact_id=bundle_id,
@@ -286,6 +292,7 @@ def artifact_bundle_manifest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             bundle_id = locals().get("bundle_id")
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="error",
                 artifact_id=bundle_id if isinstance(bundle_id, str) else None,
@@ -28,7 +28,7 @@ from typing import Any, Dict, List, Tuple
 from uuid import uuid4
 
 from adam_os.artifacts.registry import ArtifactRegistry, sha256_file, file_size_bytes
-from adam_os.engineering.activity_events import log_tool_execution
+from adam_os.engineering.activity_events import activity_log_path, log_tool_execution
 from adam_os.memory.canonical import canonical_dumps
 
 
@@ -73,7 +73,7 @@ def _load_sanitized(path: Path) -> List[Dict[str, Any]]:
     return out
 
 
-def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+def artifact_canon_select(tool_input: Dict[str, Any], *, artifact_root: Path = ARTIFACT_ROOT) -> Dict[str, Any]:
     if not isinstance(tool_input, dict):
         raise TypeError("tool_input must be dict")
 
@@ -81,6 +81,11 @@ def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(created_at_utc, str) or not created_at_utc.strip():
         raise ValueError("tool_input.created_at_utc must be a non-empty injected string")
 
+    artifact_root = Path(artifact_root)
+    sanitized_dir = artifact_root / "sanitized"
+    bundles_dir = artifact_root / "bundles"
+    log_path = activity_log_path(artifact_root)
+
     try:
         media_type = tool_input.get("media_type") or DEFAULT_MEDIA_TYPE
         if not isinstance(media_type, str) or not media_type.strip():
@@ -91,7 +96,7 @@ def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("tool_input.sanitized_artifact_id must be a non-empty string")
         sanitized_id = sanitized_artifact_id.strip()
 
-        sanitized_path = SANITIZED_DIR / f"{sanitized_id}.jsonl"
+        sanitized_path = sanitized_dir / f"{sanitized_id}.jsonl"
         if not sanitized_path.exists():
             raise FileNotFoundError(f"SANITIZED artifact not found at: {sanitized_path}")
 
@@ -100,10 +105,10 @@ def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("tool_input.canon_artifact_id must be a non-empty string if provided")
         canon_id = canon_artifact_id.strip()
 
-        BUNDLES_DIR.mkdir(parents=True, exist_ok=True)
-        canon_path = BUNDLES_DIR / f"{canon_id}.jsonl"
+        bundles_dir.mkdir(parents=True, exist_ok=True)
+        canon_path = bundles_dir / f"{canon_id}.jsonl"
 
-        reg = ArtifactRegistry(artifact_root=ARTIFACT_ROOT)
+        reg = ArtifactRegistry(artifact_root=artifact_root)
 
         # Idempotency gate (no duplicate registry append)
         if canon_path.exists() and _registry_has(reg.registry_path, canon_id, "BUNDLE_MANIFEST"):
@@ -122,6 +127,7 @@ def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             }
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="idempotent",
                 artifact_id=canon_id,
@@ -171,6 +177,7 @@ def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         }
         log_tool_execution(
             created_at_utc=created_at_utc,
+            log_path=log_path,
             tool_name=TOOL_NAME,
             status="success",
             artifact_id=canon_id,
@@ -187,6 +194,7 @@ def artifact_canon_select(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             canon_id = locals().get("canon_id")
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="error",
                 artifact_id=canon_id if isinstance(canon_id, str) else None,
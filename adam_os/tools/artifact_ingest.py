@@ -42,13 +42,15 @@ from typing import Any, Dict
 from uuid import uuid4
 
 from adam_os.artifacts.registry import ArtifactRegistry, sha256_file, file_size_bytes
-from adam_os.engineering.activity_events import log_tool_execution
+from adam_os.engineering.activity_events import activity_log_path, log_tool_execution
 
 
 TOOL_NAME = "artifact.ingest"
 
+ARTIFACT_ROOT = Path(".adam_os") / "artifacts"
 
-def artifact_ingest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+
+def artifact_ingest(tool_input: Dict[str, Any], *, artifact_root: Path = ARTIFACT_ROOT) -> Dict[str, Any]:
     """
     Write RAW artifact file + append artifact registry record (append-only).
     """
@@ -59,6 +61,9 @@ def artifact_ingest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(created_at_utc, str) or not created_at_utc.strip():
         raise ValueError("tool_input.created_at_utc must be a non-empty injected string")
 
+    artifact_root = Path(artifact_root)
+    log_path = activity_log_path(artifact_root)
+
     try:
         content = tool_input.get("content")
         if not isinstance(content, str) or not content:
@@ -74,7 +79,6 @@ def artifact_ingest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(artifact_id, str) or not artifact_id.strip():
             raise ValueError("tool_input.artifact_id must be a non-empty string if provided")
 
-        artifact_root = Path(".adam_os") / "artifacts"
         raw_dir = artifact_root / "raw"
         raw_dir.mkdir(parents=True, exist_ok=True)
 
@@ -98,6 +102,7 @@ def artifact_ingest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
 
         log_tool_execution(
             created_at_utc=created_at_utc,
+            log_path=log_path,
             tool_name=TOOL_NAME,
             status="success",
             artifact_id=artifact_id,
@@ -123,6 +128,7 @@ def artifact_ingest(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             artifact_id = locals().get("artifact_id")
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="error",
                 artifact_id=artifact_id if isinstance(artifact_id, str) else None,
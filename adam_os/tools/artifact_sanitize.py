@@ -23,7 +23,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from adam_os.artifacts.registry import ArtifactRegistry, sha256_file, file_size_bytes
-from adam_os.engineering.activity_events import log_tool_execution
+from adam_os.engineering.activity_events import activity_log_path, log_tool_execution
 from adam_os.memory.canonical import canonical_dumps
 
 
@@ -103,14 +103,14 @@ def _to_jsonl(statements: List[str]) -> str:
     return ("\n".join(lines) + "\n") if lines else ""
 
 
-def _ensure_within_raw_dir(raw_path: Path) -> None:
-    raw_dir = RAW_DIR.resolve()
+def _ensure_within_raw_dir(raw_path: Path, raw_dir: Path = RAW_DIR) -> None:
+    raw_dir = raw_dir.resolve()
     p = raw_path.resolve()
     if raw_dir not in p.parents and p != raw_dir:
         raise ValueError("raw_path must be within .adam_os/artifacts/raw/")
 
 
-def _resolve_raw(tool_input: Dict[str, Any]) -> Tuple[str, Path]:
+def _resolve_raw(tool_input: Dict[str, Any], raw_dir: Path = RAW_DIR) -> Tuple[str, Path]:
     raw_artifact_id = tool_input.get("raw_artifact_id")
     raw_path_in = tool_input.get("raw_path")
 
@@ -118,13 +118,13 @@ def _resolve_raw(tool_input: Dict[str, Any]) -> Tuple[str, Path]:
         if not isinstance(raw_artifact_id, str) or not raw_artifact_id.strip():
             raise ValueError("tool_input.raw_artifact_id must be a non-empty string if provided")
         rid = raw_artifact_id.strip()
-        return rid, RAW_DIR / f"{rid}.txt"
+        return rid, raw_dir / f"{rid}.txt"
 
     if raw_path_in is not None:
         if not isinstance(raw_path_in, str) or not raw_path_in.strip():
             raise ValueError("tool_input.raw_path must be a non-empty string if provided")
         p = Path(raw_path_in)
-        _ensure_within_raw_dir(p)
+        _ensure_within_raw_dir(p, raw_dir)
         rid = p.stem
         if not rid:
             raise ValueError("raw_path must have a filename stem usable as raw_artifact_id")
@@ -145,7 +145,7 @@ def _registry_has(registry_path: Path, artifact_id: str, kind: str) -> bool:
     return False
 
 
-def artifact_sanitize(tool_input: Dict[str, Any]) -> Dict[str, Any]:
+def artifact_sanitize(tool_input: Dict[str, Any], *, artifact_root: Path = ARTIFACT_ROOT) -> Dict[str, Any]:
     if not isinstance(tool_input, dict):
         raise TypeError("tool_input must be dict")
 
@@ -153,12 +153,17 @@ def artifact_sanitize(tool_input: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(created_at_utc, str) or not created_at_utc.strip():
         raise ValueError("tool_input.created_at_utc must be a non-empty injected string")
 
+    artifact_root = Path(artifact_root)
+    raw_dir = artifact_root / "raw"
+    sanitized_dir = artifact_root / "sanitized"
+    log_path = activity_log_path(artifact_root)
+
     try:
         media_type = tool_input.get("media_type") or DEFAULT_MEDIA_TYPE
         if not isinstance(media_type, str) or not media_type.strip():
             raise ValueError("tool_input.media_type must be a non-empty string")
 
-        raw_id, raw_path = _resolve_raw(tool_input)
+        raw_id, raw_path = _resolve_raw(tool_input, raw_dir)
         if not raw_path.exists():
             raise FileNotFoundError(f"RAW artifact not found at: {raw_path}")
 
@@ -167,10 +172,10 @@ def artifact_sanitize(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("tool_input.sanitized_artifact_id must be a non-empty string if provided")
         sanitized_id = sanitized_artifact_id.strip()
 
-        SANITIZED_DIR.mkdir(parents=True, exist_ok=True)
-        sanitized_path = SANITIZED_DIR / f"{sanitized_id}.jsonl"
+        sanitized_dir.mkdir(parents=True, exist_ok=True)
+        sanitized_path = sanitized_dir / f"{sanitized_id}.jsonl"
 
-        reg = ArtifactRegistry(artifact_root=ARTIFACT_ROOT)
+        reg = ArtifactRegistry(artifact_root=artifact_root)
 
         # Idempotency gate (no duplicate registry append)
         if sanitized_path.exists() and _registry_has(reg.registry_path, sanitized_id, "SANITIZED"):
@@ -189,6 +194,7 @@ def artifact_sanitize(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             }
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="idempotent",
                 artifact_id=sanitized_id,
@@ -230,6 +236,7 @@ def artifact_sanitize(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         }
         log_tool_execution(
             created_at_utc=created_at_utc,
+            log_path=log_path,
             tool_name=TOOL_NAME,
             status="success",
             artifact_id=sanitized_id,
@@ -246,6 +253,7 @@ def artifact_sanitize(tool_input: Dict[str, Any]) -> Dict[str, Any]:
             sanitized_id = locals().get("sanitized_id")
             log_tool_execution(
                 created_at_utc=created_at_utc,
+                log_path=log_path,
                 tool_name=TOOL_NAME,
                 status="error",
                 artifact_id=sanitized_id if isinstance(sanitized_id, str) else None,
@@ -49,6 +49,8 @@ DEFAULT_MEDIA_TYPE_MANIFEST = "application/json"
 
 DEFAULT_ENCRYPTION_SCHEME = "openssl-enc-aes-256-cbc-pbkdf2-salt"
 
+TAR_WRITE_BUFFER = 1024 * 1024
+
 
 def _registry_has(registry_path: Path, artifact_id: str, kind: str) -> bool:
     if not registry_path.exists():
@@ -99,9 +101,10 @@ def _collect_files(roots: List[Path]) -> List[Tuple[Path, str]]:
     return items
 
 
-def _add_file_deterministic(tf: tarfile.TarFile, file_path: Path, arcname: str) -> None:
+def _add_file_deterministic(tf: tarfile.TarFile, file_path: Path, arcname: str) -> int:
     """
     Add a single file with deterministic tar metadata.
+    Returns the file size recorded in the archive.
     """
     st = file_path.stat()
 
@@ -117,6 +120,7 @@ def _add_file_deterministic(tf: tarfile.TarFile, file_path: Path, arcname: str)
 
     with file_path.open("rb") as f:
         tf.addfile(ti, fileobj=f)
+    return ti.size
 
 
 def _build_plain_tar(tar_path: Path, roots: List[Path]) -> Dict[str, Any]:
@@ -129,11 +133,13 @@ def _build_plain_tar(tar_path: Path, roots: List[Path]) -> Dict[str, Any]:
     tar_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Use GNU tar format for broad compatibility; determinism enforced via TarInfo fields.
-    with tarfile.open(tar_path, mode="w", format=tarfile.GNU_FORMAT) as tf:
-        for fp, arcname in files:
-            _add_file_deterministic(tf, fp, arcname)
+    # A 1 MiB write buffer turns tarfile's many small block writes into few syscalls.
+    total = 0
+    with tar_path.open("wb", buffering=TAR_WRITE_BUFFER) as raw:
+        with tarfile.open(fileobj=raw, mode="w", format=tarfile.GNU_FORMAT) as tf:
+            for fp, arcname in files:
+                total += _add_file_deterministic(tf, fp, arcname)
 
-    total = sum(fp.stat().st_size for fp, _ in files)
     return {"file_count": len(files), "total_bytes": int(total)}
 
 
@@ -305,28 +311,31 @@ def artifact_snapshot_export(tool_input: Dict[str, Any]) -> Dict[str, Any]:
         manifest_text = canonical_dumps(manifest_obj) + "\n"
         manifest_path.write_text(manifest_text, encoding="utf-8")
 
-        # Registry append (append-only): archive + manifest
-        reg.append_from_file(
-            artifact_id=snapshot_id,
-            kind="SNAPSHOT_ARCHIVE",
-            created_at_utc=created_at_utc,
-            file_path=enc_path,
-            media_type=media_type_archive.strip(),
-            parent_artifact_ids=[work_order_id],
-            notes="artifact.snapshot_export",
-            tags=["phase7", "snapshot_archive"],
-        )
-
+        # Registry append (append-only): archive + manifest in one write
         manifest_artifact_id = f"{snapshot_id}--manifest"
-        reg.append_from_file(
-            artifact_id=manifest_artifact_id,
-            kind="SNAPSHOT_MANIFEST",
-            created_at_utc=created_at_utc,
-            file_path=manifest_path,
-            media_type=media_type_manifest.strip(),
-            parent_artifact_ids=[work_order_id],
-            notes="artifact.snapshot_export",
-            tags=["phase7", "snapshot_manifest"],
+        reg.append_many(
+            [
+                reg.record_from_file(
+                    artifact_id=snapshot_id,
+                    kind="SNAPSHOT_ARCHIVE",
+                    created_at_utc=created_at_utc,
+                    file_path=enc_path,
+                    media_type=media_type_archive.strip(),
+                    parent_artifact_ids=[work_order_id],
+                    notes="artifact.snapshot_export",
+                    tags=["phase7", "snapshot_archive"],
+                ),
+                reg.record_from_file(
+                    artifact_id=manifest_artifact_id,
+                    kind="SNAPSHOT_MANIFEST",
+                    created_at_utc=created_at_utc,
+                    file_path=manifest_path,
+                    media_type=media_type_manifest.strip(),
+                    parent_artifact_ids=[work_order_id],
+                    notes="artifact.snapshot_export",
+                    tags=["phase7", "snapshot_manifest"],
+                ),
+            ]
         )
 
         return {
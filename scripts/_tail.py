@@ -0,0 +1,53 @@
+# Procedure: Shared runner helper - read the last lines of an append-only JSONL file
+"""scripts._tail
+
+Reverse-block tail for the runner scripts. They are run directly
+(`python scripts/<name>.py`), which puts this directory on sys.path, so they
+import it as a sibling module: `from _tail import tail_lines`.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, List, Optional
+
+
+def tail_lines(
+    path: Path,
+    n: int,
+    block: int = 65536,
+    predicate: Optional[Callable[[bytes], bool]] = None,
+) -> List[str]:
+    """Return the last n lines of path, reading fixed-size blocks backwards from EOF.
+
+    Only the final block(s) are read, so cost follows n, not the file size.
+    With predicate, the last n lines are filtered as raw bytes and only the
+    matches are decoded (in file order). Raises FileNotFoundError if path
+    does not exist.
+    """
+    if n <= 0:
+        return []
+    chunks: List[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+            # n lines need n + 1 separators (the extra one bounds the first
+            # line), counting a trailing newline at EOF.
+            if newlines > n:
+                break
+    data = b"".join(reversed(chunks))
+    if pos > 0:
+        # Drop the partial first line before decoding: the block cut may split a UTF-8 sequence.
+        data = data[data.index(b"\n") + 1 :]
+    lines = data.splitlines()[-n:]
+    if predicate is not None:
+        lines = [b for b in lines if predicate(b)]
+    return [b.decode("utf-8") for b in lines]
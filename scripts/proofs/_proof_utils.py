@@ -0,0 +1,279 @@
+# Procedure: Shared proof helpers (JSONL reads, line counts, registry probes)
+"""scripts.proofs._proof_utils
+
+Helpers shared by the proof scripts. Proofs are run directly
+(`python scripts/proofs/<name>.py`), which puts this directory on sys.path,
+so they import it as a sibling module: `from _proof_utils import ...`.
+
+Rules:
+- Read-only: nothing here writes under .adam_os/.
+- Missing files read as empty (0 lines, no rows, not present).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from adam_os.execution_core.executor import LocalExecutor, get_executor
+
+
+def executor() -> LocalExecutor:
+    """Process-wide LocalExecutor; proofs run back-to-back in one process share it."""
+    return get_executor()
+
+
+# provider -> inference.provider_select result (read-only view).
+_PROVIDER_SELECT: Dict[str, Mapping[str, Any]] = {}
+
+
+def provider_select(provider: str) -> Mapping[str, Any]:
+    """inference.provider_select via the shared executor, memoized per provider.
+
+    The tool is pure (static caps, no I/O, no registry), so proofs running in
+    one process reuse the first answer. Policy-gate decisions are not cached.
+    """
+    v = _PROVIDER_SELECT.get(provider)
+    if v is None:
+        v = MappingProxyType(executor().execute_tool("inference.provider_select", {"provider": provider}))
+        _PROVIDER_SELECT[provider] = v
+    return v
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    # map/filter keep the per-line loop in C; json.loads takes bytes and
+    # tolerates the surrounding whitespace, so blank lines are the only skip.
+    return list(map(json.loads, filter(bytes.strip, path.read_bytes().splitlines())))
+
+
+def count_lines(path: Path) -> int:
+    # readinto one reused buffer + bytearray.count over the filled span: the
+    # scan runs in C (memchr-speed), never decodes UTF-8, and allocates no
+    # per-block bytes objects.
+    try:
+        f = path.open("rb", buffering=0)
+    except FileNotFoundError:
+        return 0
+    buf = bytearray(1 << 20)
+    n = 0
+    last = 0x0A
+    with f:
+        while True:
+            got = f.readinto(buf)
+            if not got:
+                break
+            n += buf.count(b"\n", 0, got)
+            last = buf[got - 1]
+    # A final line without a trailing newline still counts.
+    if last != 0x0A:
+        n += 1
+    return n
+
+
+def tail_lines(path: Path, n: int, block: int = 65536) -> List[bytes]:
+    """Return the last n lines of path (trailing newlines dropped), reading backwards from EOF.
+
+    Only the final block(s) are read, so cost does not grow with file size.
+    """
+    if n <= 0:
+        return []
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            # n complete lines need n separators once trailing newlines are dropped
+            if buf.rstrip(b"\n").count(b"\n") >= n:
+                break
+    return buf.rstrip(b"\n").splitlines()[-n:]
+
+
+# Bound decode of one shared decoder: skips json.loads' per-call kwarg and
+# bytes-encoding detection on the per-line registry parse.
+_DECODE = json.JSONDecoder().decode
+
+# Per-path (size, newline_count, line_count) from the previous line_snapshot call.
+_SNAPSHOTS: Dict[str, Tuple[int, int, int]] = {}
+
+
+def line_snapshot(path: Path) -> Tuple[int, int]:
+    """Return (line_count, byte_size) for an append-only file.
+
+    The previous snapshot of the same path is remembered, so a later call only
+    counts newlines in the bytes appended since then; an unchanged size costs
+    one stat. A file that shrank (rewritten) is recounted from the start.
+    """
+    # Plain str path + os.path.getsize: no Path wrapper or stat_result on the hot probe.
+    key = os.fspath(path)
+    size = os.path.getsize(key)
+    prev = _SNAPSHOTS.get(key)
+    if prev is not None and prev[0] == size:
+        return prev[2], size
+    start, newlines = (prev[0], prev[1]) if prev is not None and prev[0] < size else (0, 0)
+    with open(key, "rb") as f:
+        f.seek(start)
+        suffix = f.read(size - start)
+    newlines += suffix.count(b"\n")
+    # A final line without a trailing newline still counts.
+    lines = newlines + (1 if suffix and not suffix.endswith(b"\n") else 0)
+    _SNAPSHOTS[key] = (size, newlines, lines)
+    return lines, size
+
+
+def _artifact_id_of(row: Dict[str, Any]) -> Optional[str]:
+    aid = row.get("artifact_id")
+    return aid if isinstance(aid, str) else None
+
+
+def tail_find_ids(
+    path: Path,
+    want_ids: Iterable[str],
+    *,
+    stop_at: Optional[str] = None,
+    id_of: Callable[[Dict[str, Any]], Optional[str]] = _artifact_id_of,
+    block: int = 16384,
+) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """Find the newest JSONL row for each wanted id, scanning backwards from EOF.
+
+    Returns {artifact_id: (lines_from_end, row)}, lines_from_end being 1 for
+    the last line. Only lines containing one of the ids as a quoted string are
+    parsed. Scanning stops once every id is found, or once stop_at is found (an
+    id known to precede the others, e.g. the request that later rows bind to);
+    otherwise it runs back to the start of the file.
+    """
+    want = set(want_ids)
+    if stop_at is not None:
+        want.add(stop_at)
+    needles = [b'"' + aid.encode("utf-8") + b'"' for aid in want]
+    found: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return found
+    back = 0
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        rest = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + rest).split(b"\n")
+            # lines[0] may be cut mid-line; carry it into the next (earlier) block.
+            rest = lines[0] if pos > 0 else b""
+            for line in reversed(lines[1:] if pos > 0 else lines):
+                if not line.strip():
+                    continue
+                back += 1
+                if not any(nd in line for nd in needles):
+                    continue
+                row = _DECODE(line.decode("utf-8"))
+                aid = id_of(row) if isinstance(row, dict) else None
+                if aid in want and aid not in found:
+                    found[aid] = (back, row)
+                    if aid == stop_at or len(found) == len(want):
+                        return found
+    return found
+
+
+def tail_bytes(path: Path, n: int = 65536) -> bytes:
+    """Return the final n bytes of path (b"" if missing)."""
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return b""
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - n))
+        return f.read()
+
+
+def contains_all(path: Path, needles: Sequence[bytes], tail: int = 65536) -> bool:
+    """True if every needle occurs in path.
+
+    Append-only files put fresh records at the end, so the tail window is
+    checked first; the full file is read only if a needle is missing there.
+    All needles are matched by one compiled alternation, so each window is
+    scanned once rather than once per needle.
+    """
+    wanted = set(needles)
+    # Longest first so a needle that prefixes another cannot shadow it.
+    pat = re.compile(b"|".join(re.escape(nd) for nd in sorted(wanted, key=len, reverse=True)))
+
+    def _found(data: bytes) -> bool:
+        return wanted.issubset(pat.findall(data))
+
+    window = tail_bytes(path, tail)
+    if _found(window):
+        return True
+    if len(window) < tail:
+        return False  # window already was the whole file
+    return _found(path.read_bytes())
+
+
+def last_line(path: Path, block: int = 65536) -> Optional[bytes]:
+    """Return the last non-empty line of path (without newline), or None."""
+    lines = tail_lines(path, 1, block=block)
+    return lines[-1] if lines else None
+
+
+def tail_tool_events(events: List[Dict[str, Any]], tool_name: str) -> List[Dict[str, Any]]:
+    return [e for e in events if e.get("event_type") == "tool_execute" and e.get("tool_name") == tool_name]
+
+
+def registry_has(registry_path: Path, artifact_id: str, kind: str) -> bool:
+    """True if one registry line carries both artifact_id and kind.
+
+    Registry lines are canonical JSON (sorted keys), so "artifact_id" always
+    precedes "kind"; one compiled bytes pattern finds both in a single pass.
+    """
+    pat = re.compile(
+        rb'"artifact_id":"' + re.escape(artifact_id.encode("utf-8"))
+        + rb'"[^\n]*"kind":"' + re.escape(kind.encode("utf-8")) + rb'"'
+    )
+    try:
+        data = registry_path.read_bytes()
+    except FileNotFoundError:
+        return False
+    return pat.search(data) is not None
+
+
+# PROOF_PRETTY=1 restores the indented, key-sorted result dump for humans.
+PRETTY = os.environ.get("PROOF_PRETTY") == "1"
+
+
+def dump_result(obj: Any) -> str:
+    """Serialize a proof's final result: compact by default, pretty under PROOF_PRETTY=1."""
+    if PRETTY:
+        return json.dumps(obj, sort_keys=True, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+__all__ = [
+    "executor",
+    "provider_select",
+    "read_jsonl",
+    "count_lines",
+    "tail_lines",
+    "last_line",
+    "tail_bytes",
+    "line_snapshot",
+    "tail_find_ids",
+    "contains_all",
+    "tail_tool_events",
+    "registry_has",
+    "dump_result",
+]
@@ -9,24 +9,12 @@ from uuid import uuid4
 from adam_os.memory.canonical import canonical_dumps
 from adam_os.tools.artifact_canon_select import artifact_canon_select
 from adam_os.tools.engineering_log_append import DEFAULT_ACTIVITY_LOG_PATH
+from _proof_utils import read_jsonl
 
 
 ACT_LOG = Path(DEFAULT_ACTIVITY_LOG_PATH)
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            out.append(json.loads(line))
-    return out
-
-
 def _last_tool_event(events: List[Dict[str, Any]], tool_name: str) -> Dict[str, Any]:
     for e in reversed(events):
         if e.get("event_type") == "tool_execute" and e.get("tool_name") == tool_name:
@@ -45,7 +33,7 @@ def _write_sanitized_jsonl(path: Path) -> None:
 
 
 def main() -> None:
-    before = _read_jsonl(ACT_LOG)
+    before = read_jsonl(ACT_LOG)
     before_n = len(before)
 
     artifact_root = Path(".adam_os") / "artifacts"
@@ -72,7 +60,7 @@ def main() -> None:
     assert r1["kind"] == "BUNDLE_MANIFEST"
     assert r1["artifact_id"] == canon_id
 
-    mid = _read_jsonl(ACT_LOG)
+    mid = read_jsonl(ACT_LOG)
     assert len(mid) == before_n + 1, "expected exactly 1 new engineering event after success call"
 
     last_mid = _last_tool_event(mid, "artifact.canon_select")
@@ -92,7 +80,7 @@ def main() -> None:
     assert r2["kind"] == "BUNDLE_MANIFEST"
     assert r2["artifact_id"] == r1["artifact_id"]
 
-    mid2 = _read_jsonl(ACT_LOG)
+    mid2 = read_jsonl(ACT_LOG)
     assert len(mid2) == before_n + 2, "expected exactly 1 new engineering event after idempotent call"
 
     last_mid2 = _last_tool_event(mid2, "artifact.canon_select")
@@ -112,7 +100,7 @@ def main() -> None:
     except FileNotFoundError:
         pass
 
-    after = _read_jsonl(ACT_LOG)
+    after = read_jsonl(ACT_LOG)
     assert len(after) == before_n + 3, "expected exactly 1 additional engineering event after error case"
 
     last_after = _last_tool_event(after, "artifact.canon_select")
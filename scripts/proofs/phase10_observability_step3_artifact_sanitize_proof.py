@@ -7,24 +7,12 @@ from typing import Any, Dict, List
 
 from adam_os.tools.artifact_sanitize import artifact_sanitize
 from adam_os.tools.engineering_log_append import DEFAULT_ACTIVITY_LOG_PATH
+from _proof_utils import read_jsonl
 
 
 ACT_LOG = Path(DEFAULT_ACTIVITY_LOG_PATH)
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            out.append(json.loads(line))
-    return out
-
-
 def _last_tool_event(events: List[Dict[str, Any]], tool_name: str) -> Dict[str, Any]:
     for e in reversed(events):
         if e.get("event_type") == "tool_execute" and e.get("tool_name") == tool_name:
@@ -33,7 +21,7 @@ def _last_tool_event(events: List[Dict[str, Any]], tool_name: str) -> Dict[str,
 
 
 def main() -> None:
-    before = _read_jsonl(ACT_LOG)
+    before = read_jsonl(ACT_LOG)
     before_n = len(before)
 
     artifact_root = Path(".adam_os") / "artifacts"
@@ -60,7 +48,7 @@ def main() -> None:
     assert r1["kind"] == "SANITIZED"
     assert r1["artifact_id"] == sanitized_id
 
-    mid = _read_jsonl(ACT_LOG)
+    mid = read_jsonl(ACT_LOG)
     assert len(mid) == before_n + 1, "expected exactly 1 new engineering event after success call"
 
     last_mid = _last_tool_event(mid, "artifact.sanitize")
@@ -80,7 +68,7 @@ def main() -> None:
     assert r2["kind"] == "SANITIZED"
     assert r2["artifact_id"] == r1["artifact_id"]
 
-    mid2 = _read_jsonl(ACT_LOG)
+    mid2 = read_jsonl(ACT_LOG)
     assert len(mid2) == before_n + 2, "expected exactly 1 new engineering event after idempotent call"
 
     last_mid2 = _last_tool_event(mid2, "artifact.sanitize")
@@ -100,7 +88,7 @@ def main() -> None:
     except FileNotFoundError:
         pass
 
-    after = _read_jsonl(ACT_LOG)
+    after = read_jsonl(ACT_LOG)
     assert len(after) == before_n + 3, "expected exactly 1 additional engineering event after error case"
 
     last_after = _last_tool_event(after, "artifact.sanitize")
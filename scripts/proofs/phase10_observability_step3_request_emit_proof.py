@@ -8,17 +8,40 @@ from adam_os.tools.inference_request_emit import inference_request_emit
 from adam_os.tools.engineering_log_append import DEFAULT_ACTIVITY_LOG_PATH
 
 
+def _git_head_sha() -> str:
+    # Resolve HEAD from .git directly (loose ref, then packed-refs); only
+    # fall back to forking `git` for layouts we don't read (worktrees, etc.).
+    git_dir = Path(".git")
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[len("ref: "):]
+        try:
+            return (git_dir / ref).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            with (git_dir / "packed-refs").open("r", encoding="utf-8") as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return subprocess.check_output(["git","rev-parse","HEAD"]).decode().strip()
+
+
 def _snapshot_hash64() -> str:
-    head = subprocess.check_output(["git","rev-parse","HEAD"]).decode().strip()
+    head = _git_head_sha()
     return hashlib.sha256(head.encode("utf-8")).hexdigest()
 
 
 def main() -> None:
     log_path = Path(DEFAULT_ACTIVITY_LOG_PATH)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_path.touch(exist_ok=True)
-
-    before_lines = log_path.read_text(encoding="utf-8").splitlines()
+    # Missing log reads as empty; append_engineering_event creates it on first write.
+    try:
+        before_count = log_path.read_bytes().count(b"\n")
+    except FileNotFoundError:
+        before_count = 0
     snap = _snapshot_hash64()
 
     tool_input = {
@@ -35,9 +58,10 @@ def main() -> None:
 
     out = inference_request_emit(tool_input)
 
-    after_lines = log_path.read_text(encoding="utf-8").splitlines()
-    assert len(after_lines) == len(before_lines) + 1, (len(before_lines), len(after_lines))
-    last = after_lines[-1]
+    after_bytes = log_path.read_bytes()
+    after_count = after_bytes.count(b"\n")
+    assert after_count == before_count + 1, (before_count, after_count)
+    last = after_bytes.splitlines()[-1].decode("utf-8")
 
     assert "\"event_type\":\"tool_execute\"" in last
     assert "\"tool_name\":\"inference.request_emit\"" in last
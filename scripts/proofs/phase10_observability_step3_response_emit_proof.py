@@ -5,22 +5,18 @@ import json
 from pathlib import Path
 
 from adam_os.tools.inference_response_emit import inference_response_emit
+from _proof_utils import count_lines, last_line
 
 ENGINEERING_LOG = Path(".adam_os") / "engineering" / "activity_log.jsonl"
 RESPONSES_DIR = Path(".adam_os") / "inference" / "responses"
 
 
-def _lines(path: Path) -> list[str]:
-    if not path.exists():
-        return []
-    return path.read_text(encoding="utf-8").splitlines()
-
-
 def _last_event() -> dict | None:
-    ls = _lines(ENGINEERING_LOG)
-    if not ls:
+    # Tail-seek: only the final block of the log is read.
+    last = last_line(ENGINEERING_LOG)
+    if last is None:
         return None
-    return json.loads(ls[-1])
+    return json.loads(last)
 
 
 def main() -> None:
@@ -32,8 +28,7 @@ def main() -> None:
     if resp_path.exists():
         resp_path.unlink()
 
-    before_lines = _lines(ENGINEERING_LOG)
-    before_n = len(before_lines)
+    before_n = count_lines(ENGINEERING_LOG)
 
     out = inference_response_emit(
         {
@@ -49,8 +44,7 @@ def main() -> None:
     )
     assert out["artifact_id"] == response_id
 
-    after_lines = _lines(ENGINEERING_LOG)
-    assert len(after_lines) == before_n + 1
+    assert count_lines(ENGINEERING_LOG) == before_n + 1
 
     evt1 = _last_event()
     assert evt1 is not None
@@ -63,7 +57,7 @@ def main() -> None:
     assert evt1.get("idempotent") is False
 
     # Second run should be idempotent and append another event with idempotent=True
-    before2_n = len(_lines(ENGINEERING_LOG))
+    before2_n = count_lines(ENGINEERING_LOG)
     out2 = inference_response_emit(
         {
             "created_at_utc": "2026-02-17T00:00:11Z",
@@ -78,8 +72,7 @@ def main() -> None:
     )
     assert out2["artifact_id"] == response_id
 
-    after2_lines = _lines(ENGINEERING_LOG)
-    assert len(after2_lines) == before2_n + 1
+    assert count_lines(ENGINEERING_LOG) == before2_n + 1
 
     evt2 = _last_event()
     assert evt2 is not None
@@ -0,0 +1,152 @@
+# Procedure: Phase 7 runner proof - run_phase7 batch + --parallel (input order, per-input failure, literal paths)
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Ensure repo root and scripts/ (run_phase7 imports its sibling _tail) are on sys.path.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+for _p in (REPO_ROOT, REPO_ROOT / "scripts"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import run_phase7  # noqa: E402
+from adam_os.execution_core.errors import ToolExecutionError  # noqa: E402
+from _proof_utils import registry_has  # noqa: E402
+
+CREATED_AT_UTC = "2026-02-20T00:00:00Z"
+LABELS = [label for label, _, _ in run_phase7.STAGES]
+
+ARTIFACTS_ROOT = Path(".adam_os") / "artifacts"
+RAW_DIR = ARTIFACTS_ROOT / "raw"
+REGISTRY_PATH = ARTIFACTS_ROOT / "artifact_registry.jsonl"
+
+
+def _run_main(argv: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+    """Run run_phase7.main and parse its batch output into [(input path, {label: artifact_id})]."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rc = run_phase7.main(argv)
+    if rc != 0:
+        raise AssertionError(f"run_phase7 returned {rc}")
+    lines = buf.getvalue().splitlines()
+    if not lines or lines[-1] != "PIPELINE COMPLETE":
+        raise AssertionError(f"missing PIPELINE COMPLETE: {lines[-1:]}")
+    sections: List[Tuple[str, Dict[str, str]]] = []
+    for line in lines[:-1]:
+        key, _, value = line.partition(": ")
+        if key == "INPUT":
+            sections.append((value, {}))
+        elif sections:
+            sections[-1][1][key] = value
+        else:
+            raise AssertionError(f"stage line before any INPUT header: {line}")
+    return sections
+
+
+def _check_sections(sections: List[Tuple[str, Dict[str, str]]], expected: List[Tuple[Path, str]]) -> None:
+    """Sections must follow input order, and each RAW artifact must hold that input's content."""
+    got_paths = [p for p, _ in sections]
+    want_paths = [str(p) for p, _ in expected]
+    if got_paths != want_paths:
+        raise AssertionError(f"output order mismatch: {got_paths} != {want_paths}")
+    for (path, ids), (_, content) in zip(sections, expected):
+        if list(ids) != LABELS:
+            raise AssertionError(f"{path}: stage labels {list(ids)} != {LABELS}")
+        raw = (RAW_DIR / f"{ids['RAW']}.txt").read_text(encoding="utf-8")
+        if raw != content:
+            raise AssertionError(f"{path}: RAW artifact content does not match its input")
+        # Each stage id derives from the previous one, so a cross-wired input shows up here.
+        for prev, cur in zip(LABELS, LABELS[1:]):
+            if not ids[cur].startswith(ids[prev] + "--"):
+                raise AssertionError(f"{path}: {cur} id {ids[cur]} does not derive from {prev} id {ids[prev]}")
+        if not registry_has(REGISTRY_PATH, ids["WORK_ORDER"], "WORK_ORDER"):
+            raise AssertionError(f"{path}: registry missing WORK_ORDER {ids['WORK_ORDER']}")
+
+
+def _raw_ids_by_content() -> Dict[str, str]:
+    return {p.read_text(encoding="utf-8"): p.stem for p in RAW_DIR.glob("*.txt")} if RAW_DIR.exists() else {}
+
+
+def _check_failure_isolated(label: str, run) -> None:
+    """One empty input fails ingest; the others must still finish every stage, then the error surfaces."""
+    good = [f"{label} first input.", f"{label} third input."]
+    try:
+        run([good[0], "", good[1]])
+    except ToolExecutionError as ex:
+        if "content" not in str(ex):
+            raise AssertionError(f"{label}: unexpected error: {ex}")
+    else:
+        raise AssertionError(f"{label}: failing input did not raise")
+    raw_ids = _raw_ids_by_content()
+    for content in good:
+        raw_id = raw_ids.get(content)
+        if raw_id is None:
+            raise AssertionError(f"{label}: no RAW artifact for surviving input {content!r}")
+        wo_id = raw_id + "".join(f"--{s}" for s in ("sanitized", "canon", "bundle", "build_spec", "work_order"))
+        if not registry_has(REGISTRY_PATH, wo_id, "WORK_ORDER"):
+            raise AssertionError(f"{label}: surviving input {content!r} did not reach WORK_ORDER")
+
+
+def run(tmp_root: Path) -> None:
+    in_dir = tmp_root / "in"
+    in_dir.mkdir()
+    inputs: Dict[str, str] = {
+        "a.txt": "Alpha source statement.",
+        "b.txt": "Bravo source statement.",
+        "c.txt": "Charlie source statement.",
+        "d[1].txt": "Delta source statement.",
+    }
+    for name, content in inputs.items():
+        (in_dir / name).write_text(content + "\n", encoding="utf-8")
+
+    def expected(*names: str) -> List[Tuple[Path, str]]:
+        return [(in_dir / n, inputs[n]) for n in names]
+
+    # A) Stage pipeline over a directory: inputs in sorted order.
+    sections = _run_main([str(in_dir), "--created_at_utc", CREATED_AT_UTC])
+    _check_sections(sections, expected("a.txt", "b.txt", "c.txt", "d[1].txt"))
+
+    # B) --parallel over explicit files: output follows argument order, not completion order.
+    order = ["c.txt", "a.txt", "d[1].txt", "b.txt"]
+    argv = [str(in_dir / n) for n in order] + ["--created_at_utc", CREATED_AT_UTC, "--parallel", "2"]
+    _check_sections(_run_main(argv), expected(*order))
+
+    # C) A literal file whose name has glob characters is used as-is next to a real glob.
+    argv = [str(in_dir / "d[1].txt"), str(in_dir / "a*.txt"), "--created_at_utc", CREATED_AT_UTC]
+    _check_sections(_run_main(argv), expected("d[1].txt", "a.txt"))
+
+    # D) A glob matching nothing fails rather than being dropped.
+    try:
+        _run_main([str(in_dir / "a.txt"), str(in_dir / "zz*.txt"), "--created_at_utc", CREATED_AT_UTC])
+    except SystemExit as ex:
+        if "no inputs matched" not in str(ex):
+            raise AssertionError(f"unexpected exit: {ex}")
+    else:
+        raise AssertionError("unmatched glob did not fail")
+
+    # E) One failing input in a batch: the rest complete, the error is raised after.
+    args = run_phase7._PARSER.parse_args(["-", "--created_at_utc", CREATED_AT_UTC])
+    _check_failure_isolated("pipeline", lambda contents: run_phase7.run_batch(contents, args))
+    _check_failure_isolated("parallel", lambda contents: asyncio.run(run_phase7.run_parallel(contents, args, 2)))
+
+
+def main() -> None:
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as td:
+        os.chdir(td)
+        try:
+            run(Path(td))
+        finally:
+            os.chdir(cwd)
+    print("phase7_runner_batch_proof OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,25 +5,7 @@ import json
 from pathlib import Path
 
 from adam_os.execution_core.executor import LocalExecutor
-
-
-def _count_lines(p: Path) -> int:
-    if not p.exists():
-        return 0
-    with p.open("r", encoding="utf-8") as f:
-        return sum(1 for _ in f)
-
-
-def _registry_has(registry_path: Path, artifact_id: str, kind: str) -> bool:
-    if not registry_path.exists():
-        return False
-    needle_id = f"\"artifact_id\":\"{artifact_id}\""
-    needle_kind = f"\"kind\":\"{kind}\""
-    with registry_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if needle_id in line and needle_kind in line:
-                return True
-    return False
+from _proof_utils import count_lines, registry_has
 
 
 def main() -> None:
@@ -46,7 +28,7 @@ def main() -> None:
     snapshot_id = f"proof-step10-snapshot-{work_order_hash[:12]}"
 
     registry_path = Path(".adam_os") / "artifacts" / "artifact_registry.jsonl"
-    before_lines = _count_lines(registry_path)
+    before_lines = count_lines(registry_path)
 
     # Dev-only passphrase (no secrets); keep deterministic idempotency focus.
     passphrase = "dev-passphrase-step10"
@@ -88,17 +70,17 @@ def main() -> None:
         raise RuntimeError("manifest.archive_enc_sha256 invalid")
 
     # Registry append-only + linkage checks
-    after_lines = _count_lines(registry_path)
+    after_lines = count_lines(registry_path)
     if after_lines < before_lines:
         raise RuntimeError("registry line count decreased (append-only violated)")
 
-    if not _registry_has(registry_path, snapshot_id, "SNAPSHOT_ARCHIVE"):
+    if not registry_has(registry_path, snapshot_id, "SNAPSHOT_ARCHIVE"):
         raise RuntimeError("registry missing SNAPSHOT_ARCHIVE record for snapshot_id")
-    if not _registry_has(registry_path, f"{snapshot_id}--manifest", "SNAPSHOT_MANIFEST"):
+    if not registry_has(registry_path, f"{snapshot_id}--manifest", "SNAPSHOT_MANIFEST"):
         raise RuntimeError("registry missing SNAPSHOT_MANIFEST record")
 
     # Idempotency check: re-run should not append duplicates
-    mid_lines = _count_lines(registry_path)
+    mid_lines = count_lines(registry_path)
     r2 = e.execute_tool(
         "artifact.snapshot_export",
         {
@@ -109,7 +91,7 @@ def main() -> None:
             "included_roots": [".adam_os/artifacts", ".adam_os/runs"],
         },
     )
-    end_lines = _count_lines(registry_path)
+    end_lines = count_lines(registry_path)
     if end_lines != mid_lines:
         raise RuntimeError("idempotency violated: registry line count changed on second run")
 
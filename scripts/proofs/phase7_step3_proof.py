@@ -4,7 +4,7 @@ Proof: Phase 7 Step 3 artifact registry is append-only + schema-valid.
 
 This proof:
 - Creates a small RAW artifact file under .adam_os/artifacts/raw/
-- Appends 2 registry records referencing files
+- Appends 2 registry records referencing files (one batched write)
 - Verifies registry grows by exactly 2 lines
 - Verifies each line parses as valid ArtifactRecord
 """
@@ -44,26 +44,29 @@ def main() -> None:
     f1.write_text("phase7 step3 proof file 1\n", encoding="utf-8")
     f2.write_text("phase7 step3 proof file 2\n", encoding="utf-8")
 
-    reg.append_from_file(
-        artifact_id="proof-artifact-1",
-        kind="RAW",
-        created_at_utc=created_at_utc,
-        file_path=f1,
-        media_type="text/plain",
-        parent_artifact_ids=[],
-        notes="phase7 step3 proof",
-        tags=["proof", "phase7", "step3"],
-    )
-
-    reg.append_from_file(
-        artifact_id="proof-artifact-2",
-        kind="RAW",
-        created_at_utc=created_at_utc,
-        file_path=f2,
-        media_type="text/plain",
-        parent_artifact_ids=[],
-        notes="phase7 step3 proof",
-        tags=["proof", "phase7", "step3"],
+    reg.append_many(
+        [
+            reg.record_from_file(
+                artifact_id="proof-artifact-1",
+                kind="RAW",
+                created_at_utc=created_at_utc,
+                file_path=f1,
+                media_type="text/plain",
+                parent_artifact_ids=[],
+                notes="phase7 step3 proof",
+                tags=["proof", "phase7", "step3"],
+            ),
+            reg.record_from_file(
+                artifact_id="proof-artifact-2",
+                kind="RAW",
+                created_at_utc=created_at_utc,
+                file_path=f2,
+                media_type="text/plain",
+                parent_artifact_ids=[],
+                notes="phase7 step3 proof",
+                tags=["proof", "phase7", "step3"],
+            ),
+        ]
     )
 
     after = sum(1 for _ in registry_path.open("r", encoding="utf-8"))
@@ -72,7 +75,8 @@ def main() -> None:
         raise SystemExit(f"FAIL: registry line count expected {before+2}, got {after}")
 
     # validate the last two lines parse as ArtifactRecord
-    lines = registry_path.read_text(encoding="utf-8").splitlines()
+    # json.loads accepts bytes directly; no need to decode the whole registry first
+    lines = registry_path.read_bytes().splitlines()
     for i in (-2, -1):
         d = json.loads(lines[i])
         ArtifactRecord.from_dict(d)
@@ -18,12 +18,7 @@ from pathlib import Path as _Path
 sys.path.insert(0, str(_Path(__file__).resolve().parents[2]))
 
 from adam_os.execution_core.executor import LocalExecutor
-
-
-def count_lines(path: Path) -> int:
-    if not path.exists():
-        return 0
-    return sum(1 for _ in path.open("r", encoding="utf-8"))
+from _proof_utils import count_lines
 
 
 def main() -> None:
@@ -13,13 +13,7 @@ if str(REPO_ROOT) not in sys.path:
 from adam_os.tools.artifact_ingest import artifact_ingest
 from adam_os.tools.artifact_sanitize import artifact_sanitize
 from adam_os.artifacts.registry import ArtifactRegistry
-
-
-def _count_lines(p: Path) -> int:
-    if not p.exists():
-        return 0
-    with p.open("r", encoding="utf-8") as f:
-        return sum(1 for _ in f)
+from _proof_utils import count_lines, tail_lines
 
 
 def main() -> int:
@@ -46,7 +40,7 @@ def main() -> int:
     )
 
     # 2) Sanitize once
-    before_lines = _count_lines(reg.registry_path)
+    before_lines = count_lines(reg.registry_path)
 
     sanitize_res_1 = artifact_sanitize(
         {
@@ -64,7 +58,7 @@ def main() -> int:
     sanitized_path = Path(sanitize_res_1["sanitized_path"])
     assert sanitized_path.exists(), "sanitized file missing"
 
-    mid_lines = _count_lines(reg.registry_path)
+    mid_lines = count_lines(reg.registry_path)
     assert mid_lines == before_lines + 1, "expected exactly one registry append for first sanitize"
 
     # 3) Sanitize again (idempotency): should not append another SANITIZED row
@@ -75,19 +69,21 @@ def main() -> int:
         }
     )
 
-    after_lines = _count_lines(reg.registry_path)
+    after_lines = count_lines(reg.registry_path)
     assert sanitize_res_2["sha256"] == sanitize_res_1["sha256"], "sanitize not deterministic"
     assert after_lines == mid_lines, "idempotency violated (registry line count changed on second sanitize)"
 
     # 4) Confirm registry tail contains sanitized id + parent linkage (best-effort scan tail)
-    tail = reg.registry_path.read_text(encoding="utf-8").strip().splitlines()[-12:]
+    tail = tail_lines(reg.registry_path, 12)
     found = False
     sanitized_id = sanitize_res_1["artifact_id"]
+    needle_id = f"\"artifact_id\":\"{sanitized_id}\"".encode("utf-8")
+    needle_parent = f"\"parent_artifact_ids\":[\"{raw_id}\"]".encode("utf-8")
     for line in tail:
         if (
-            f"\"artifact_id\":\"{sanitized_id}\"" in line
-            and "\"kind\":\"SANITIZED\"" in line
-            and f"\"parent_artifact_ids\":[\"{raw_id}\"]" in line
+            needle_id in line
+            and b"\"kind\":\"SANITIZED\"" in line
+            and needle_parent in line
         ):
             found = True
             break
@@ -1,7 +1,11 @@
 # Procedure: Proof for Phase 7 Step 6 (canon select) - deterministic, append-only registry, idempotent
 from __future__ import annotations
 
+import hashlib
+import mmap
+import re
 import sys
+from secrets import token_hex
 from pathlib import Path
 
 # Ensure repo root is on sys.path so `import adam_os` works when running `python scripts/proofs/...`
@@ -10,8 +14,9 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from pathlib import Path as _Path  # noqa: E402
-from uuid import uuid4  # noqa: E402
+from typing import List, Tuple  # noqa: E402
 
+from adam_os.artifacts.registry import sha256_file  # noqa: E402
 from adam_os.tools.artifact_ingest import artifact_ingest  # noqa: E402
 from adam_os.tools.artifact_sanitize import artifact_sanitize  # noqa: E402
 from adam_os.tools.artifact_canon_select import artifact_canon_select  # noqa: E402
@@ -21,23 +26,48 @@ ARTIFACT_ROOT = _Path(".adam_os") / "artifacts"
 REGISTRY_PATH = ARTIFACT_ROOT / "artifact_registry.jsonl"
 
 
-def _count_registry(artifact_id: str, kind: str) -> int:
+# Above this size the registry is mmapped and scanned with one regex instead of line-by-line.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _count_registry_multi(pairs: List[Tuple[str, str]]) -> List[int]:
+    """Count registry lines for each (artifact_id, kind) pair in a single pass."""
+    counts = [0] * len(pairs)
     if not REGISTRY_PATH.exists():
-        return 0
-    needle_id = f"\"artifact_id\":\"{artifact_id}\""
-    needle_kind = f"\"kind\":\"{kind}\""
-    n = 0
-    with REGISTRY_PATH.open("r", encoding="utf-8") as f:
+        return counts
+    needles = [
+        (f"\"artifact_id\":\"{aid}\"".encode("utf-8"), f"\"kind\":\"{kind}\"".encode("utf-8"))
+        for aid, kind in pairs
+    ]
+    with REGISTRY_PATH.open("rb") as f:
+        if REGISTRY_PATH.stat().st_size > _MMAP_THRESHOLD:
+            # Canonical registry lines sort "artifact_id" before "kind"; at most one match per line.
+            ids = b"|".join(re.escape(aid.encode("utf-8")) for aid, _ in pairs)
+            kinds = b"|".join(re.escape(kind.encode("utf-8")) for _, kind in pairs)
+            pat = re.compile(rb"\"artifact_id\":\"(" + ids + rb")\"[^\n]*\"kind\":\"(" + kinds + rb")\"")
+            slot = {(aid.encode("utf-8"), kind.encode("utf-8")): i for i, (aid, kind) in enumerate(pairs)}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for m in pat.finditer(mm):
+                    i = slot.get((m.group(1), m.group(2)))
+                    if i is not None:
+                        counts[i] += 1
+            return counts
         for line in f:
-            if needle_id in line and needle_kind in line:
-                n += 1
-    return n
+            for i, (needle_id, needle_kind) in enumerate(needles):
+                # The short kind needle rejects most lines before the longer id scan runs.
+                if needle_kind in line and needle_id in line:
+                    counts[i] += 1
+    return counts
+
+
+def _count_registry(artifact_id: str, kind: str) -> int:
+    return _count_registry_multi([(artifact_id, kind)])[0]
 
 
 def main() -> None:
     created_at_utc = "2026-02-12T00:00:00Z"  # injected constant (no clock)
 
-    run_id = str(uuid4())[:8]
+    run_id = token_hex(4)  # 8 hex chars, same shape as the old uuid4 prefix
     raw_id = f"proof-step6-raw-{run_id}"
     sanitized_id = f"proof-step6-sanitized-{run_id}"
     canon_id = f"proof-step6-canon-{run_id}"
@@ -52,9 +82,9 @@ def main() -> None:
         "AdamOS stores artifacts under .adam_os.\n"
     )
 
-    r0 = _count_registry(raw_id, "RAW")
-    s0 = _count_registry(sanitized_id, "SANITIZED")
-    c0 = _count_registry(canon_id, "BUNDLE_MANIFEST")
+    r0, s0, c0 = _count_registry_multi(
+        [(raw_id, "RAW"), (sanitized_id, "SANITIZED"), (canon_id, "BUNDLE_MANIFEST")]
+    )
 
     ingest_out = artifact_ingest(
         {
@@ -90,8 +120,9 @@ def main() -> None:
     assert _count_registry(canon_id, "BUNDLE_MANIFEST") == c0 + 1
 
     canon_path = _Path(canon_out_1["canon_path"])
-    assert canon_path.exists()
-    content_1 = canon_path.read_text(encoding="utf-8")
+    # Trust the tool's return: a missing file surfaces as FileNotFoundError on this read.
+    content_1 = canon_path.read_bytes()
+    h1 = hashlib.sha256(content_1).hexdigest()
 
     # Second canon run (idempotent: no new registry append, identical output)
     canon_out_2 = artifact_canon_select(
@@ -104,11 +135,11 @@ def main() -> None:
     assert canon_out_2["artifact_id"] == canon_id
     assert _count_registry(canon_id, "BUNDLE_MANIFEST") == c0 + 1
 
-    content_2 = canon_path.read_text(encoding="utf-8")
-    assert content_1 == content_2
+    # Stream-hash the second state instead of holding a second copy in memory.
+    assert sha256_file(canon_path) == h1
 
     # Safety sanity: output must contain only SOURCE-BASED lines
-    for line in content_1.splitlines():
+    for line in content_1.decode("utf-8").splitlines():
         if not line.strip():
             continue
         assert "\"type\":\"SOURCE-BASED\"" in line
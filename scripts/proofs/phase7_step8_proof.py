@@ -1,7 +1,7 @@
 # Procedure: Phase 7 Step 8 proof - deterministic prompt_hash + registry append-only + idempotency (robust sys.path)
 from __future__ import annotations
 
-import os
+import hashlib
 import sys
 import tempfile
 from pathlib import Path
@@ -14,11 +14,7 @@ if str(REPO_ROOT) not in sys.path:
 from adam_os.artifacts.registry import ArtifactRegistry, sha256_file
 from adam_os.memory.canonical import canonical_dumps
 from adam_os.tools.artifact_build_spec import artifact_build_spec
-
-
-def _sha256_text(s: str) -> str:
-    import hashlib
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+from _proof_utils import count_lines
 
 
 def _write_bundle_manifest(tmp_root: Path, bundle_id: str, created_at_utc: str) -> Path:
@@ -34,88 +30,92 @@ def _write_bundle_manifest(tmp_root: Path, bundle_id: str, created_at_utc: str)
     ]
 
     payload = {"bundle_id": bundle_id, "kind": "BUNDLE_MANIFEST", "created_at_utc": created_at_utc, "members": members}
-    payload_canon = canonical_dumps(payload)
-    bundle_hash = _sha256_text(payload_canon)
+    # Encode the canonical form once; the same bytes feed the hash and the file.
+    payload_canon = canonical_dumps(payload).encode("utf-8")
+    bundle_hash = hashlib.sha256(payload_canon).hexdigest()
 
-    final_obj = dict(payload)
-    final_obj["bundle_hash"] = bundle_hash
+    # "bundle_hash" sorts ahead of every payload key, so the canonical form of
+    # {**payload, "bundle_hash": ...} is payload_canon with that field spliced in first.
+    final_canon = b'{"bundle_hash":"' + bundle_hash.encode("ascii") + b'",' + payload_canon[1:]
 
-    bundle_path.write_text(canonical_dumps(final_obj) + "\n", encoding="utf-8")
+    bundle_path.write_bytes(final_canon + b"\n")
     return bundle_path
 
 
 def _registry_line_count(path: Path) -> int:
-    if not path.exists():
-        return 0
-    return sum(1 for _ in path.open("r", encoding="utf-8"))
+    return count_lines(path)
 
 
-def main() -> None:
+def run(tmp_root: Path) -> None:
     created_at_utc = "2026-02-12T00:00:00Z"
 
+    artifacts_root = tmp_root / ".adam_os" / "artifacts"
+    reg = ArtifactRegistry(artifact_root=artifacts_root)
+
+    bundle_id = "bundle-1"
+    bundle_path = _write_bundle_manifest(tmp_root, bundle_id=bundle_id, created_at_utc=created_at_utc)
+    reg.append_from_file(
+        artifact_id=bundle_id,
+        kind="BUNDLE_MANIFEST",
+        created_at_utc=created_at_utc,
+        file_path=bundle_path,
+        media_type="application/json",
+        parent_artifact_ids=["canon-1"],
+        notes="proof_seed_bundle_manifest",
+        tags=["phase7", "bundle_manifest"],
+    )
+
+    before_lines = _registry_line_count(reg.registry_path)
+
+    out1 = artifact_build_spec(
+        {
+            "created_at_utc": created_at_utc,
+            "bundle_artifact_id": bundle_id,
+            "provider": "mock",
+            "model": "mock-1",
+            "temperature": 0.0,
+            "max_tokens": 256,
+            "inferred_notes": "mocked inference output for proof determinism",
+        },
+        artifact_root=artifacts_root,
+    )
+
+    spec_path = Path(out1["spec_path"])
+    assert spec_path.exists(), "BUILD_SPEC file not created"
+    assert out1["kind"] == "BUILD_SPEC"
+    assert isinstance(out1.get("prompt_hash"), str) and len(out1["prompt_hash"]) == 64
+    assert isinstance(out1.get("bundle_hash"), str) and len(out1["bundle_hash"]) == 64
+
+    mid_lines = _registry_line_count(reg.registry_path)
+    assert mid_lines == before_lines + 1, "registry should append exactly one BUILD_SPEC record"
+
+    out2 = artifact_build_spec(
+        {
+            "created_at_utc": created_at_utc,
+            "bundle_artifact_id": bundle_id,
+            "provider": "mock",
+            "model": "mock-1",
+            "temperature": 0.0,
+            "max_tokens": 256,
+            "inferred_notes": "mocked inference output for proof determinism",
+        },
+        artifact_root=artifacts_root,
+    )
+
+    after_lines = _registry_line_count(reg.registry_path)
+    assert after_lines == mid_lines, "idempotency failed: registry appended again"
+
+    assert out2["prompt_hash"] == out1["prompt_hash"], "prompt_hash must be stable across runs"
+    assert out2["bundle_hash"] == out1["bundle_hash"], "bundle_hash must be stable across runs"
+
+    spec_sha = sha256_file(spec_path)
+    assert spec_sha == out1["sha256"], "returned sha256 must match file sha256"
+
+
+def main() -> None:
+    # Each run owns its root; no process-wide chdir, so proofs can run side by side.
     with tempfile.TemporaryDirectory() as td:
-        tmp_root = Path(td)
-        os.chdir(tmp_root)
-
-        artifacts_root = Path(".adam_os") / "artifacts"
-        reg = ArtifactRegistry(artifact_root=artifacts_root)
-
-        bundle_id = "bundle-1"
-        bundle_path = _write_bundle_manifest(tmp_root, bundle_id=bundle_id, created_at_utc=created_at_utc)
-        reg.append_from_file(
-            artifact_id=bundle_id,
-            kind="BUNDLE_MANIFEST",
-            created_at_utc=created_at_utc,
-            file_path=bundle_path,
-            media_type="application/json",
-            parent_artifact_ids=["canon-1"],
-            notes="proof_seed_bundle_manifest",
-            tags=["phase7", "bundle_manifest"],
-        )
-
-        before_lines = _registry_line_count(reg.registry_path)
-
-        out1 = artifact_build_spec(
-            {
-                "created_at_utc": created_at_utc,
-                "bundle_artifact_id": bundle_id,
-                "provider": "mock",
-                "model": "mock-1",
-                "temperature": 0.0,
-                "max_tokens": 256,
-                "inferred_notes": "mocked inference output for proof determinism",
-            }
-        )
-
-        spec_path = Path(out1["spec_path"])
-        assert spec_path.exists(), "BUILD_SPEC file not created"
-        assert out1["kind"] == "BUILD_SPEC"
-        assert isinstance(out1.get("prompt_hash"), str) and len(out1["prompt_hash"]) == 64
-        assert isinstance(out1.get("bundle_hash"), str) and len(out1["bundle_hash"]) == 64
-
-        mid_lines = _registry_line_count(reg.registry_path)
-        assert mid_lines == before_lines + 1, "registry should append exactly one BUILD_SPEC record"
-
-        out2 = artifact_build_spec(
-            {
-                "created_at_utc": created_at_utc,
-                "bundle_artifact_id": bundle_id,
-                "provider": "mock",
-                "model": "mock-1",
-                "temperature": 0.0,
-                "max_tokens": 256,
-                "inferred_notes": "mocked inference output for proof determinism",
-            }
-        )
-
-        after_lines = _registry_line_count(reg.registry_path)
-        assert after_lines == mid_lines, "idempotency failed: registry appended again"
-
-        assert out2["prompt_hash"] == out1["prompt_hash"], "prompt_hash must be stable across runs"
-        assert out2["bundle_hash"] == out1["bundle_hash"], "bundle_hash must be stable across runs"
-
-        spec_sha = sha256_file(spec_path)
-        assert spec_sha == out1["sha256"], "returned sha256 must match file sha256"
+        run(Path(td))
 
     print("phase7_step8_proof OK")
 
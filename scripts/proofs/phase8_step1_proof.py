@@ -9,11 +9,11 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import contains_all, executor  # noqa: E402
 
 
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
     created_at_utc = "2026-02-14T00:00:00Z"
     snapshot_hash = "a" * 64  # deterministic placeholder for proof
@@ -35,7 +35,7 @@ def main() -> None:
     p = Path(r1["request_path"])
     assert p.exists(), "request file not created"
 
-    obj = json.loads(p.read_text(encoding="utf-8"))
+    obj = json.loads(p.read_bytes())
     assert obj["kind"] == "inference.request"
     assert obj["created_at_utc"] == created_at_utc
     assert obj["snapshot_hash"] == snapshot_hash
@@ -52,9 +52,10 @@ def main() -> None:
     assert Path(r2["request_path"]).exists()
 
     # Basic registry presence: must contain artifact_id + kind
-    txt = reg_path.read_text(encoding="utf-8")
-    assert f"\"artifact_id\":\"{r1['artifact_id']}\"" in txt
-    assert "\"kind\":\"INFERENCE_REQUEST\"" in txt
+    assert contains_all(
+        reg_path,
+        [f"\"artifact_id\":\"{r1['artifact_id']}\"".encode("utf-8"), b"\"kind\":\"INFERENCE_REQUEST\""],
+    )
 
     print("phase8_step1_proof OK")
 
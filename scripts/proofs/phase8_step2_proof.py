@@ -3,11 +3,14 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
 from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import executor  # noqa: E402
 
 
 def must_fail(e: LocalExecutor, tool_input: dict, contains: str) -> None:
@@ -19,10 +22,18 @@ def must_fail(e: LocalExecutor, tool_input: dict, contains: str) -> None:
         assert contains in msg, f"expected '{contains}' in error, got: {msg}"
 
 
+def _with(base: Mapping[str, Any], **overrides: Any) -> Dict[str, Any]:
+    return {**base, **overrides}
+
+
+def _without(base: Mapping[str, Any], key: str) -> Dict[str, Any]:
+    return {k: v for k, v in base.items() if k != key}
+
+
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
-    base = {
+    base = MappingProxyType({
         "created_at_utc": "2026-02-14T00:00:00Z",
         "snapshot_hash": "b" * 64,
         "provider": "openai",
@@ -32,31 +43,23 @@ def main() -> None:
         "temperature": 0.0,
         "max_tokens": 16,
         "provider_max_tokens_cap": 1024,
-    }
+    })
 
     # PASS baseline (should not raise)
     r = e.execute_tool("inference.request_emit", dict(base))
     assert r["kind"] == "INFERENCE_REQUEST"
 
     # FAIL: model not allowlisted
-    bad_model = dict(base)
-    bad_model["model"] = "gpt-4o-mini"
-    must_fail(e, bad_model, "model not allowlisted")
+    must_fail(e, _with(base, model="gpt-4o-mini"), "model not allowlisted")
 
     # FAIL: temperature out of bounds
-    bad_temp = dict(base)
-    bad_temp["temperature"] = 1.5
-    must_fail(e, bad_temp, "temperature out of bounds")
+    must_fail(e, _with(base, temperature=1.5), "temperature out of bounds")
 
     # FAIL: max_tokens exceeds cap
-    bad_tokens = dict(base)
-    bad_tokens["max_tokens"] = 2048
-    must_fail(e, bad_tokens, "exceeds provider hard cap")
+    must_fail(e, _with(base, max_tokens=2048), "exceeds provider hard cap")
 
     # FAIL: missing cap injection
-    bad_cap = dict(base)
-    del bad_cap["provider_max_tokens_cap"]
-    must_fail(e, bad_cap, "provider_max_tokens_cap")
+    must_fail(e, _without(base, "provider_max_tokens_cap"), "provider_max_tokens_cap")
 
     print("phase8_step2_proof OK")
 
@@ -8,11 +8,11 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import contains_all, executor  # noqa: E402
 
 
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
     created_at_utc = "2026-02-14T00:00:00Z"
     snapshot_hash = "c" * 64
@@ -32,25 +32,27 @@ def main() -> None:
     rreq = e.execute_tool("inference.request_emit", req_in)
     req_id = rreq["artifact_id"]
 
-    req_obj = json.loads(Path(rreq["request_path"]).read_text(encoding="utf-8"))
+    req_obj = json.loads(Path(rreq["request_path"]).read_bytes())
     request_hash = req_obj["request_hash"]
 
     # 2) Emit response
-    resp_in = {
+    # Fields shared by the response and error inputs; each input dict is built
+    # once and passed unchanged to both the first and the idempotent call.
+    binding = {
         "created_at_utc": created_at_utc,
         "request_id": req_id,
         "request_hash": request_hash,
         "snapshot_hash": snapshot_hash,
         "provider": "openai",
         "model": "gpt-4.1-mini",
-        "output_text": "stub response text",
     }
+    resp_in = {**binding, "output_text": "stub response text"}
     r1 = e.execute_tool("inference.response_emit", resp_in)
     assert r1["kind"] == "INFERENCE_RESPONSE"
     rp = Path(r1["response_path"])
     assert rp.exists()
 
-    robj = json.loads(rp.read_text(encoding="utf-8"))
+    robj = json.loads(rp.read_bytes())
     assert robj["kind"] == "inference.response"
     assert robj["request_id"] == req_id
     assert robj["request_hash"] == request_hash
@@ -61,12 +63,7 @@ def main() -> None:
 
     # 3) Emit error
     err_in = {
-        "created_at_utc": created_at_utc,
-        "request_id": req_id,
-        "request_hash": request_hash,
-        "snapshot_hash": snapshot_hash,
-        "provider": "openai",
-        "model": "gpt-4.1-mini",
+        **binding,
         "error_type": "PROVIDER_TIMEOUT",
         "message": "timeout",
         "details": "stub details",
@@ -76,7 +73,7 @@ def main() -> None:
     ep = Path(e1["error_path"])
     assert ep.exists()
 
-    eobj = json.loads(ep.read_text(encoding="utf-8"))
+    eobj = json.loads(ep.read_bytes())
     assert eobj["kind"] == "inference.error"
     assert eobj["request_id"] == req_id
     assert eobj["request_hash"] == request_hash
@@ -87,11 +84,15 @@ def main() -> None:
 
     # 4) Registry contains both entries
     reg = Path(r1["registry_path"])
-    txt = reg.read_text(encoding="utf-8")
-    assert f"\"artifact_id\":\"{r1['artifact_id']}\"" in txt
-    assert "\"kind\":\"INFERENCE_RESPONSE\"" in txt
-    assert f"\"artifact_id\":\"{e1['artifact_id']}\"" in txt
-    assert "\"kind\":\"INFERENCE_ERROR\"" in txt
+    assert contains_all(
+        reg,
+        [
+            f"\"artifact_id\":\"{r1['artifact_id']}\"".encode("utf-8"),
+            b"\"kind\":\"INFERENCE_RESPONSE\"",
+            f"\"artifact_id\":\"{e1['artifact_id']}\"".encode("utf-8"),
+            b"\"kind\":\"INFERENCE_ERROR\"",
+        ],
+    )
 
     print("phase8_step3_proof OK")
 
@@ -2,41 +2,66 @@
 from __future__ import annotations
 
 import json
-import shutil
+import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # Ensure repo root is on sys.path so `import adam_os` works even without PYTHONPATH
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import executor, provider_select  # noqa: E402
+
+
+INFERENCE_ROOT = Path(".adam_os") / "inference"
+RECEIPTS_DIR = INFERENCE_ROOT / "receipts"
+RESPONSES_DIR = INFERENCE_ROOT / "responses"
 
 
 def must_fail(fn, contains: str) -> None:
     try:
         fn()
-        raise AssertionError("expected failure, but succeeded")
     except Exception as ex:
-        msg = str(ex)
-        assert contains in msg, f"expected '{contains}' in error, got: {msg}"
-
-
-def _read_request_hash(request_path: Path) -> str:
-    obj = json.loads(request_path.read_text(encoding="utf-8"))
-    rh = obj.get("request_hash")
+        # Executor errors carry their message as args[0]; use it directly rather
+        # than formatting str(ex).
+        first = ex.args[0] if ex.args else None
+        msg = first if isinstance(first, str) else str(ex)
+        if contains not in msg:
+            raise AssertionError(f"expected '{contains}' in error, got: {msg}") from ex
+        return
+    raise AssertionError("expected failure, but succeeded")
+
+
+def _read_request_hash(rreq: Mapping[str, Any]) -> str:
+    # request_emit already returns the hash it computed; read the artifact only if absent.
+    rh = rreq.get("request_hash")
+    if rh is None:
+        rh = json.loads(Path(rreq["request_path"]).read_text(encoding="utf-8")).get("request_hash")
     assert isinstance(rh, str) and len(rh) == 64
     return rh
 
 
+def _stash(path: Path) -> Path:
+    # Rename aside (same dir, atomic): the file "goes missing" with no data copy.
+    backup = path.with_suffix(".json.bak_step7")
+    os.replace(path, backup)
+    return backup
+
+
+def _restore(path: Path, backup: Path) -> None:
+    os.replace(backup, path)  # same inode back: bytes and stat metadata intact
+
+
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
     created_at_utc = "2026-02-14T00:00:00Z"
     snapshot_hash = "d" * 64
 
     # --- Provider select (deterministic) ---
-    p = e.execute_tool("inference.provider_select", {"provider": "openai"})
+    p = provider_select("openai")
     provider = p["provider"]
     provider_cap = int(p["provider_max_tokens_cap"])
 
@@ -57,10 +82,11 @@ def main() -> None:
         "max_tokens": 32,
         "provider_max_tokens_cap": provider_cap,
     }
-    rreq = e.execute_tool("inference.request_emit", req_in)
+    # Template for every later request variant; read-only so no cycle can mutate it.
+    req_in = MappingProxyType(req_in)
+    rreq = e.execute_tool("inference.request_emit", dict(req_in))
     request_id = rreq["artifact_id"]
-    request_path = Path(rreq["request_path"])
-    request_hash = _read_request_hash(request_path)
+    request_hash = _read_request_hash(rreq)
 
     rresp = e.execute_tool(
         "inference.response_emit",
@@ -98,34 +124,31 @@ def main() -> None:
     # - non-allowlisted model
     # - max_tokens > provider_cap
     # =========================================================================
-    bad_model = dict(req_in)
-    bad_model["user_prompt"] = "phase8_step7_bad_model"
-    bad_model["model"] = "gpt-4o-mini"  # known rejected in Step 2 proof
-    must_fail(lambda: e.execute_tool("inference.request_emit", bad_model), "model not allowlisted")
+    # known rejected in Step 2 proof
+    bad_model = {**req_in, "user_prompt": "phase8_step7_bad_model", "model": "gpt-4o-mini"}
 
-    bad_tokens = dict(req_in)
-    bad_tokens["user_prompt"] = "phase8_step7_bad_tokens"
-    bad_tokens["max_tokens"] = provider_cap + 1
+    bad_tokens = {**req_in, "user_prompt": "phase8_step7_bad_tokens", "max_tokens": provider_cap + 1}
+
+    must_fail(lambda: e.execute_tool("inference.request_emit", bad_model), "model not allowlisted")
     must_fail(lambda: e.execute_tool("inference.request_emit", bad_tokens), "exceeds provider hard cap")
 
     # =========================================================================
     # C1) Integrity/tamper cycle: tamper receipt file then replay must fail
     # (No sed; rewrite via json load/dump)
     # =========================================================================
-    receipt_path = Path(".adam_os") / "inference" / "receipts" / f"{receipt_id}.json"
+    receipt_path = RECEIPTS_DIR / f"{receipt_id}.json"
     assert receipt_path.exists(), "expected receipt file for tamper test"
 
-    original_receipt_txt = receipt_path.read_text(encoding="utf-8")
-    obj = json.loads(original_receipt_txt)
+    original_receipt = receipt_path.read_bytes()
+    obj = json.loads(original_receipt)
     obj["provider"] = "tampered-provider"
-    receipt_path.write_text(
-        json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n",
-        encoding="utf-8",
+    receipt_path.write_bytes(
+        (json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
     )
     must_fail(lambda: e.execute_tool("inference.replay", {"receipt_id": receipt_id}), "replay_reject")
 
     # Restore receipt so later tests aren't poisoned
-    receipt_path.write_text(original_receipt_txt, encoding="utf-8")
+    receipt_path.write_bytes(original_receipt)
     rreplay2 = e.execute_tool("inference.replay", {"receipt_id": receipt_id})
     assert rreplay2["status"] == "replay_ok"
 
@@ -137,11 +160,10 @@ def main() -> None:
     # =========================================================================
 
     # --- C2a: receipt_emit fails if response file missing ---
-    req2_in = dict(req_in)
-    req2_in["user_prompt"] = "phase8_step7_missing_response_receipt_emit"
+    req2_in = {**req_in, "user_prompt": "phase8_step7_missing_response_receipt_emit"}
     rreq2 = e.execute_tool("inference.request_emit", req2_in)
     request2_id = rreq2["artifact_id"]
-    request2_hash = _read_request_hash(Path(rreq2["request_path"]))
+    request2_hash = _read_request_hash(rreq2)
 
     resp2 = e.execute_tool(
         "inference.response_emit",
@@ -156,40 +178,37 @@ def main() -> None:
         },
     )
     response2_id = resp2["artifact_id"]
-    response2_path = Path(".adam_os") / "inference" / "responses" / f"{response2_id}.json"
+    response2_path = RESPONSES_DIR / f"{response2_id}.json"
     assert response2_path.exists()
 
-    # Remove response file (fail-closed), then restore afterward
-    backup_resp = response2_path.with_suffix(".json.bak_step7")
-    shutil.copy2(response2_path, backup_resp)
-    response2_path.unlink()
-
-    must_fail(
-        lambda: e.execute_tool(
-            "inference.receipt_emit",
-            {
-                "created_at_utc": created_at_utc,
-                "request_id": request2_id,
-                "request_hash": request2_hash,
-                "snapshot_hash": snapshot_hash,
-                "provider": provider,
-                "model": model_ok,
-                "response_id": response2_id,
-            },
-        ),
-        "missing response artifact file",
-    )
-
-    # restore response file
-    shutil.move(str(backup_resp), str(response2_path))
+    # Remove response file (fail-closed), then restore afterward.
+    # finally renames the stashed file back even if the check fails.
+    backup_resp = _stash(response2_path)
+    try:
+        must_fail(
+            lambda: e.execute_tool(
+                "inference.receipt_emit",
+                {
+                    "created_at_utc": created_at_utc,
+                    "request_id": request2_id,
+                    "request_hash": request2_hash,
+                    "snapshot_hash": snapshot_hash,
+                    "provider": provider,
+                    "model": model_ok,
+                    "response_id": response2_id,
+                },
+            ),
+            "missing response artifact file",
+        )
+    finally:
+        _restore(response2_path, backup_resp)
 
     # --- C2b: replay fails if referenced result file missing ---
-    # Create fresh cycle so we don't depend on restored artifacts above
-    req3_in = dict(req_in)
-    req3_in["user_prompt"] = "phase8_step7_missing_result_replay"
+    # Own request cycle, independent of C2a's artifacts
+    req3_in = {**req_in, "user_prompt": "phase8_step7_missing_result_replay"}
     rreq3 = e.execute_tool("inference.request_emit", req3_in)
     request3_id = rreq3["artifact_id"]
-    request3_hash = _read_request_hash(Path(rreq3["request_path"]))
+    request3_hash = _read_request_hash(rreq3)
 
     resp3 = e.execute_tool(
         "inference.response_emit",
@@ -219,17 +238,15 @@ def main() -> None:
     )
     receipt3_id = receipt3["artifact_id"]
 
-    response3_path = Path(".adam_os") / "inference" / "responses" / f"{response3_id}.json"
+    response3_path = RESPONSES_DIR / f"{response3_id}.json"
     assert response3_path.exists()
 
-    backup_resp3 = response3_path.with_suffix(".json.bak_step7")
-    shutil.copy2(response3_path, backup_resp3)
-    response3_path.unlink()
-
-    must_fail(lambda: e.execute_tool("inference.replay", {"receipt_id": receipt3_id}), "result file missing")
-
-    # restore response3 file so repo state isn't left broken
-    shutil.move(str(backup_resp3), str(response3_path))
+    backup_resp3 = _stash(response3_path)
+    try:
+        must_fail(lambda: e.execute_tool("inference.replay", {"receipt_id": receipt3_id}), "result file missing")
+    finally:
+        # restore response3 file so repo state isn't left broken
+        _restore(response3_path, backup_resp3)
 
     # =========================================================================
     print("phase8_step7_proof OK")
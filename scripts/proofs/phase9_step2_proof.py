@@ -4,33 +4,33 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from typing import Any, Dict, List
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import executor, tail_find_ids  # noqa: E402
 
 
 INFERENCE_ROOT = Path(".adam_os") / "inference"
 REGISTRY_PATH = INFERENCE_ROOT / "inference_registry.jsonl"
+RECEIPTS_DIR = INFERENCE_ROOT / "receipts"
 
 
-def _registry_has(artifact_id: str, kind: str) -> bool:
-    if not REGISTRY_PATH.exists():
-        return False
-    with REGISTRY_PATH.open("r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if obj.get("artifact_id") == artifact_id and obj.get("kind") == kind:
-                return True
-    return False
+def _registry_rows(artifact_ids: List[str], request_id: str) -> Dict[str, Dict[str, Any]]:
+    # Rows emitted by execute all follow the request row, so the reverse scan
+    # can stop there instead of walking the whole registry.
+    hits = tail_find_ids(REGISTRY_PATH, artifact_ids, stop_at=request_id)
+    return {aid: row for aid, (_, row) in hits.items()}
+
+
+def _registry_has(rows: Dict[str, Dict[str, Any]], artifact_id: str, kind: str) -> bool:
+    row = rows.get(artifact_id)
+    return row is not None and row.get("kind") == kind
 
 
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
     created_at_utc = "2026-02-16T00:00:00Z"
     snapshot_hash = "a" * 64
@@ -64,9 +64,10 @@ def main() -> None:
     error_id = f"{request_id}--error"
     receipt_id = f"{request_id}--receipt"
 
-    has_response = _registry_has(response_id, "INFERENCE_RESPONSE")
-    has_error = _registry_has(error_id, "INFERENCE_ERROR")
-    has_receipt = _registry_has(receipt_id, "INFERENCE_RECEIPT")
+    rows = _registry_rows([response_id, error_id, receipt_id], request_id)
+    has_response = _registry_has(rows, response_id, "INFERENCE_RESPONSE")
+    has_error = _registry_has(rows, error_id, "INFERENCE_ERROR")
+    has_receipt = _registry_has(rows, receipt_id, "INFERENCE_RECEIPT")
 
     if not (has_response or has_error):
         raise AssertionError("missing both INFERENCE_RESPONSE and INFERENCE_ERROR")
@@ -74,7 +75,7 @@ def main() -> None:
     if not has_receipt:
         raise AssertionError("missing INFERENCE_RECEIPT")
 
-    receipt_path = INFERENCE_ROOT / "receipts" / f"{receipt_id}.json"
+    receipt_path = RECEIPTS_DIR / f"{receipt_id}.json"
     if not receipt_path.exists():
         raise AssertionError(f"missing receipt artifact file: {receipt_path}")
 
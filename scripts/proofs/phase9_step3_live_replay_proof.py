@@ -1,16 +1,15 @@
 # Procedure: Phase 9 Step 3 proof — live execute + deterministic replay integrity (no provider re-call)
 from __future__ import annotations
 
-import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import dump_result, executor, line_snapshot, provider_select, tail_find_ids  # noqa: E402
 
 
 @dataclass(frozen=True)
@@ -21,17 +20,6 @@ class RegistryHit:
     raw: Dict[str, Any]
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            rows.append(json.loads(line))
-    return rows
-
-
 def _require(cond: bool, msg: str) -> None:
     if not cond:
         raise AssertionError(msg)
@@ -45,25 +33,28 @@ def _registry_path() -> Path:
 
 
 def _registry_snapshot(registry_path: Path) -> Tuple[int, int]:
-    st = registry_path.stat()
-    line_count = 0
-    with registry_path.open("r", encoding="utf-8") as f:
-        for _ in f:
-            line_count += 1
-    return (line_count, st.st_size)
-
-
-def _find_hits_for_ids(rows: List[Dict[str, Any]], artifact_ids: List[str]) -> List[RegistryHit]:
-    hits: List[RegistryHit] = []
-    want = set(artifact_ids)
-    for idx, r in enumerate(rows, start=1):
-        aid = r.get("artifact_id") or r.get("id") or r.get("result", {}).get("artifact_id") or r.get("result", {}).get("id")
-        if not isinstance(aid, str):
-            continue
-        if aid in want:
-            kind = r.get("kind") or r.get("type") or r.get("artifact_kind") or r.get("record_type") or "UNKNOWN"
-            hits.append(RegistryHit(kind=str(kind), artifact_id=aid, line_no=idx, raw=r))
-    return hits
+    # Incremental: only bytes appended since the previous snapshot are scanned.
+    return line_snapshot(registry_path)
+
+
+def _row_artifact_id(r: Dict[str, Any]) -> Optional[str]:
+    aid = r.get("artifact_id") or r.get("id")
+    if aid is None:
+        res = r.get("result")
+        if isinstance(res, dict):
+            aid = res.get("artifact_id") or res.get("id")
+    return aid if isinstance(aid, str) else None
+
+
+def _find_hits_for_ids(registry_path: Path, artifact_ids: List[str], stop_at: str) -> Dict[str, RegistryHit]:
+    # Reverse tail scan; every wanted row was appended at or after stop_at's row.
+    total_lines, _ = _registry_snapshot(registry_path)
+    found = tail_find_ids(registry_path, artifact_ids, stop_at=stop_at, id_of=_row_artifact_id)
+    by_id: Dict[str, RegistryHit] = {}
+    for aid, (back, r) in found.items():
+        kind = r.get("kind") or r.get("type") or r.get("artifact_kind") or r.get("record_type") or "UNKNOWN"
+        by_id[aid] = RegistryHit(kind=str(kind), artifact_id=aid, line_no=total_lines - back + 1, raw=r)
+    return by_id
 
 
 def _pick_artifact_id(emitted: Any) -> str:
@@ -74,17 +65,14 @@ def _pick_artifact_id(emitted: Any) -> str:
 
 
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
     created_at_utc = "2026-02-16T00:00:00Z"
     snapshot_hash = "c" * 64
 
     # Discover provider cap (no guessing)
     model = "gpt-4.1-mini"
-    caps = e.execute_tool(
-        "inference.provider_select",
-        {"created_at_utc": created_at_utc, "provider": "openai", "model": model},
-    )
+    caps = provider_select("openai")
     provider_max_tokens_cap = caps.get("provider_max_tokens_cap")
     _require(isinstance(provider_max_tokens_cap, int) and provider_max_tokens_cap > 0,
              "provider_max_tokens_cap missing/invalid from inference.provider_select")
@@ -130,21 +118,19 @@ def main() -> None:
         _require(error_id, "execute ok==False but missing emitted_error.artifact_id")
 
     # 4) Assert registry contains request + (response|error) + receipt
-    rows_after_exec = _read_jsonl(registry_path)
     want_ids = [request_id, receipt_id]
     if response_id:
         want_ids.append(response_id)
     if error_id:
         want_ids.append(error_id)
 
-    hits = _find_hits_for_ids(rows_after_exec, want_ids)
-    hit_ids = {h.artifact_id for h in hits}
-    _require(request_id in hit_ids, "registry missing request entry")
-    _require(receipt_id in hit_ids, "registry missing receipt entry")
+    by_id = _find_hits_for_ids(registry_path, want_ids, stop_at=request_id)
+    _require(request_id in by_id, "registry missing request entry")
+    _require(receipt_id in by_id, "registry missing receipt entry")
     if response_id:
-        _require(response_id in hit_ids, "registry missing response entry")
+        _require(response_id in by_id, "registry missing response entry")
     if error_id:
-        _require(error_id in hit_ids, "registry missing error entry")
+        _require(error_id in by_id, "registry missing error entry")
 
     # 5) Replay — tool input key is receipt_id (NOT receipt_artifact_id)
     pre_replay_lines, pre_replay_bytes = _registry_snapshot(registry_path)
@@ -178,7 +164,7 @@ def main() -> None:
         "execute_result": r_exec,
         "replay_result": r_replay,
     }
-    print(json.dumps(out, sort_keys=True, indent=2))
+    print(dump_result(out))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # Procedure: Phase 9 Step 5 proof - enforce dispatch boundary (no provider bypass in inference_execute)
 from __future__ import annotations
 
+import re
 import sys
 from pathlib import Path
 
@@ -8,10 +9,20 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
 
+# Direct-to-OpenAI bypasses of dispatch_text; one alternation, one scan of the source.
+_DENY = re.compile(
+    r"from adam_os\.providers\.openai_responses import responses_create_text"
+    r"|responses_create_text\("
+)
+
+
 def _read_text(p: Path) -> str:
-    if not p.exists():
-        raise SystemExit(f"missing_file: {p}")
-    return p.read_text(encoding="utf-8")
+    try:
+        data = p.read_bytes()
+    except FileNotFoundError:
+        raise SystemExit(f"missing_file: {p}") from None
+    # Strict decode, no universal-newline translation (the checks are newline-agnostic).
+    return data.decode("utf-8", "strict")
 
 
 def main() -> None:
@@ -23,13 +34,9 @@ def main() -> None:
         raise SystemExit("FAIL: inference_execute must import dispatch_text")
 
     # Must NOT bypass dispatch directly to OpenAI implementation
-    forbidden = [
-        "from adam_os.providers.openai_responses import responses_create_text",
-        "responses_create_text(",
-    ]
-    for f in forbidden:
-        if f in s:
-            raise SystemExit(f"FAIL: forbidden bypass detected in inference_execute: {f}")
+    m = _DENY.search(s)
+    if m:
+        raise SystemExit(f"FAIL: forbidden bypass detected in inference_execute: {m.group(0)}")
 
     print(
         {
@@ -27,9 +27,13 @@ def main() -> None:
             raise SystemExit(f"FAIL: wrong error for unknown provider: {e}")
 
     # 2) Anthropic is registered (static check via module text)
+    # The table sits near the top of the module: check the first 8 KiB, and
+    # only read the whole file if the entry is not there.
     p = REPO_ROOT / "adam_os" / "providers" / "dispatch.py"
-    s = p.read_text(encoding="utf-8")
-    if '"anthropic": _call_anthropic_text' not in s:
+    needle = b'"anthropic": _call_anthropic_text'
+    with p.open("rb") as f:
+        head = f.read(8192)
+    if needle not in head and needle not in p.read_bytes():
         raise SystemExit("FAIL: anthropic not registered in _TEXT_DISPATCH")
 
     print({"ok": True, "proof": "phase9_step6_anthropic_registration_proof"})
@@ -1,18 +1,31 @@
 # Procedure: Phase 9 Step 7 proof - live anthropic execution (error ok) + receipt + replay integrity
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
+from typing import Tuple
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _proof_utils import dump_result, executor, line_snapshot  # noqa: E402
+
+
+INFERENCE_ROOT = Path(".adam_os") / "inference"
+REGISTRY_PATH = INFERENCE_ROOT / "inference_registry.jsonl"
+
+
+def _registry_snapshot(registry_path: Path) -> Tuple[int, int]:
+    """(lines, bytes); only bytes appended since the previous snapshot are scanned."""
+    # One stat inside line_snapshot; no separate exists() probe to race against.
+    try:
+        return line_snapshot(registry_path)
+    except FileNotFoundError:
+        return 0, 0
 
 
 def main() -> None:
-    e = LocalExecutor()
+    e = executor()
 
     created_at_utc = "2026-02-16T00:00:00Z"
     snapshot_hash = "c" * 64
@@ -37,15 +50,13 @@ def main() -> None:
 
     # 2) Execute (Phase 9 provider boundary via dispatch)
     exec_in = {"created_at_utc": created_at_utc, "request_id": request_id}
-    registry_path = Path(".adam_os") / "inference" / "inference_registry.jsonl"
+    registry_path = REGISTRY_PATH
 
-    before_bytes = registry_path.stat().st_size if registry_path.exists() else 0
-    before_lines = len(registry_path.read_text(encoding="utf-8").splitlines()) if registry_path.exists() else 0
+    before_lines, before_bytes = _registry_snapshot(registry_path)
 
     execute_result = e.execute_tool("inference.execute", exec_in)
 
-    after_exec_bytes = registry_path.stat().st_size if registry_path.exists() else 0
-    after_exec_lines = len(registry_path.read_text(encoding="utf-8").splitlines()) if registry_path.exists() else 0
+    after_exec_lines, after_exec_bytes = _registry_snapshot(registry_path)
 
     # Must ALWAYS emit receipt
     emitted_receipt = execute_result.get("emitted_receipt") or {}
@@ -57,13 +68,11 @@ def main() -> None:
     # 3) Replay must be ok and must not write registry
     replay_in = {"created_at_utc": created_at_utc, "receipt_id": receipt_id}
 
-    replay_before_bytes = registry_path.stat().st_size if registry_path.exists() else 0
-    replay_before_lines = len(registry_path.read_text(encoding="utf-8").splitlines()) if registry_path.exists() else 0
+    replay_before_lines, replay_before_bytes = _registry_snapshot(registry_path)
 
     replay_result = e.execute_tool("inference.replay", replay_in)
 
-    replay_after_bytes = registry_path.stat().st_size if registry_path.exists() else 0
-    replay_after_lines = len(registry_path.read_text(encoding="utf-8").splitlines()) if registry_path.exists() else 0
+    replay_after_lines, replay_after_bytes = _registry_snapshot(registry_path)
 
     if replay_result.get("status") != "replay_ok":
         raise SystemExit(f"FAIL: replay status not ok: {replay_result}")
@@ -97,7 +106,7 @@ def main() -> None:
         },
         "replay_result": replay_result,
     }
-    print(json.dumps(out, indent=2, sort_keys=True))
+    print(dump_result(out))
 
 
 if __name__ == "__main__":
@@ -47,7 +47,7 @@ def main() -> None:
     if not isinstance(error_path, str) or not error_path:
         raise SystemExit("FAIL: missing emitted_error.error_path")
 
-    obj = json.loads(Path(error_path).read_text(encoding="utf-8"))
+    obj = json.loads(Path(error_path).read_bytes())
     et = obj.get("error_type")
     if et != "provider_http_error":
         raise SystemExit(f"FAIL: expected error_type=provider_http_error, got={et}")
@@ -4,14 +4,222 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import glob
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from adam_os.execution_core.executor import LocalExecutor
+from _tail import tail_lines
 
+# The executor import pulls in every tool module; it is deferred to first
+# use so --help and argument errors exit without paying for it.
+if TYPE_CHECKING:
+    from adam_os.execution_core.executor import LocalExecutor
 
-def main() -> int:
+
+# (printed label, tool name, tool_input key carrying the upstream value)
+STAGES: Tuple[Tuple[str, str, str], ...] = (
+    ("RAW", "artifact.ingest", "content"),
+    ("SANITIZED", "artifact.sanitize", "raw_artifact_id"),
+    ("CANON", "artifact.canon_select", "sanitized_artifact_id"),
+    ("BUNDLE", "artifact.bundle_manifest", "canon_artifact_id"),
+    ("BUILD_SPEC", "artifact.build_spec", "bundle_artifact_id"),
+    ("WORK_ORDER", "artifact.work_order_emit", "build_spec_artifact_id"),
+)
+
+_DONE = object()
+
+Handlers = Dict[str, Callable[[Dict[str, Any]], Any]]
+# run(content, created_at_utc[, ids]) -> [(label, artifact_id), ...]
+Runner = Callable[..., List[Tuple[str, str]]]
+
+
+def _expand_inputs(specs: List[str]) -> List[Path]:
+    """Each spec is a file, a directory (its files, sorted) or a glob pattern (sorted matches).
+
+    An existing path is taken as-is even if its name contains glob characters;
+    a pattern that matches nothing is an error.
+    """
+    out: List[Path] = []
+    for s in specs:
+        p = Path(s)
+        if p.is_dir():
+            out.extend(sorted(q for q in p.iterdir() if q.is_file()))
+        elif p.exists() or not any(c in s for c in "*?["):
+            out.append(p)
+        else:
+            matches = sorted(glob.glob(s))
+            if not matches:
+                raise SystemExit(f"ERROR: no inputs matched: {s}")
+            out.extend(Path(m) for m in matches)
+    return out
+
+
+def _read_content(p: Path, encoding: str) -> str:
+    if not p.exists():
+        raise SystemExit(f"ERROR: input not found: {p}")
+    content = p.read_text(encoding=encoding, errors="strict").strip()
+    if not content:
+        raise SystemExit("ERROR: input is empty after strip()")
+    return content
+
+
+def _stage_templates(provider: str, model: str, temperature: float, max_tokens: int) -> Tuple[Dict[str, Any], ...]:
+    """Constant tool_input keys per stage; only build_spec has any."""
+    spec = {"provider": provider, "model": model, "temperature": temperature, "max_tokens": max_tokens}
+    return tuple(spec if tool_name == "artifact.build_spec" else {} for _, tool_name, _ in STAGES)
+
+
+def bind_stages(e: LocalExecutor) -> Handlers:
+    """Resolve the six stage tools once (see LocalExecutor.bind)."""
+    return e.bind(tool_name for _, tool_name, _ in STAGES)
+
+
+def build_runner(
+    provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    handlers: Optional[Handlers] = None,
+) -> Runner:
+    """Return run(content, created_at_utc[, ids]) with the build-spec profile baked in.
+
+    Handlers and per-stage constant inputs are resolved once here; each call
+    only fills in created_at_utc and the upstream value. Drivers repeating
+    one profile build the runner once and call it per input. Stage ids are
+    appended to ids (a new list if omitted) as each stage finishes, so a
+    caller passing its own list still sees them when a later stage raises.
+    """
+    if handlers is None:
+        from adam_os.execution_core.executor import get_executor
+
+        handlers = bind_stages(get_executor())
+    steps = tuple(
+        (label, handlers[tool_name], key, template)
+        for (label, tool_name, key), template in zip(STAGES, _stage_templates(provider, model, temperature, max_tokens))
+    )
+
+    def run(content: str, created_at_utc: str, ids: Optional[List[Tuple[str, str]]] = None) -> List[Tuple[str, str]]:
+        if ids is None:
+            ids = []
+        upstream = content
+        for label, handler, key, template in steps:
+            upstream = handler({"created_at_utc": created_at_utc, key: upstream, **template})["artifact_id"]
+            ids.append((label, upstream))
+        return ids
+
+    return run
+
+
+def run_batch(contents: List[str], args: argparse.Namespace) -> List[List[Tuple[str, str]]]:
+    """Run many inputs through the stages as a pipeline, one thread per stage.
+
+    Stage k works on input t+1 while stage k+1 works on input t, so a batch
+    takes about max(stage time) per input instead of the sum. Bounded queues
+    keep at most two items waiting between stages. Each input still passes
+    the stages in order; results come back in input order. A failed input
+    is dropped from later stages and its error re-raised after the batch.
+    """
+    queues: List[queue.Queue] = [queue.Queue(maxsize=2) for _ in STAGES]
+    # created_at_utc is fixed for the whole batch: merge it into each stage's
+    # template once, so a stage call only adds the upstream id.
+    bases = tuple(
+        {"created_at_utc": args.created_at_utc, **template}
+        for template in _stage_templates(args.provider, args.model, args.temperature, args.max_tokens)
+    )
+    results: List[List[Tuple[str, str]]] = [[] for _ in contents]
+    errors: Dict[int, Exception] = {}
+
+    from adam_os.execution_core.executor import LocalExecutor
+
+    def worker(stage: int) -> None:
+        label, tool_name, key = STAGES[stage]
+        base = bases[stage]
+        src = queues[stage]
+        dst = queues[stage + 1] if stage + 1 < len(STAGES) else None
+        handler: Optional[Callable[[Dict[str, Any]], Any]] = None
+        setup_error: Optional[Exception] = None
+        try:
+            handler = LocalExecutor().bind([tool_name])[tool_name]  # per thread; holds no state
+        except Exception as ex:
+            setup_error = ex
+        # Always drain to _DONE: a worker that stops reading would fill its
+        # bounded input queue and block upstream stages (and main) forever.
+        while True:
+            item = src.get()
+            if item is _DONE:
+                if dst is not None:
+                    dst.put(_DONE)
+                return
+            idx, upstream = item
+            try:
+                if handler is None:
+                    raise setup_error
+                aid = handler({**base, key: upstream})["artifact_id"]
+            except Exception as ex:
+                errors[idx] = ex
+                continue
+            results[idx].append((label, aid))
+            if dst is not None:
+                dst.put((idx, aid))
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(len(STAGES))]
+    for t in threads:
+        t.start()
+    for idx, content in enumerate(contents):
+        queues[0].put((idx, content))
+    queues[0].put(_DONE)
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[min(errors)]
+    return results
+
+
+async def run_parallel(contents: List[str], args: argparse.Namespace, n: int) -> List[List[Tuple[str, str]]]:
+    """Run up to n inputs at once, each through all six stages in a worker thread.
+
+    Unlike run_batch, whole inputs overlap rather than stages. Results come
+    back in input order; the first failing input's error (by input order)
+    is re-raised after every input has finished.
+    """
+    run = build_runner(args.provider, args.model, args.temperature, args.max_tokens)
+    sem = asyncio.Semaphore(n)
+
+    async def run_one(content: str) -> List[Tuple[str, str]]:
+        async with sem:
+            return await asyncio.to_thread(run, content, args.created_at_utc)
+
+    # to_thread uses the loop's default executor; size it so n inputs really run at once.
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        loop.set_default_executor(pool)
+        results = await asyncio.gather(*(run_one(c) for c in contents), return_exceptions=True)
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+    return results
+
+
+def _positive_int(s: str) -> int:
+    n = int(s)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {n}")
+    return n
+
+
+def _emit(lines: List[str]) -> None:
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser()
-    ap.add_argument("input_path")
+    ap.add_argument("input_path", nargs="+", help="Input file(s); a directory or glob runs them as one batch")
     ap.add_argument("--created_at_utc", required=True)
     ap.add_argument("--provider", default="openai")
     ap.add_argument("--model", default="gpt-4o-mini")
@@ -19,64 +227,60 @@ def main() -> int:
     ap.add_argument("--max_tokens", type=int, default=1200)
     ap.add_argument("--encoding", default="utf-8")
     ap.add_argument("--registry_tail", type=int, default=0)
-    args = ap.parse_args()
+    ap.add_argument(
+        "--parallel",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help="Run up to N (>= 1) inputs concurrently, each through all stages, instead of the stage pipeline; "
+        "output is in batch form even for a single input",
+    )
+    return ap
 
-    p = Path(args.input_path)
-    if not p.exists():
-        raise SystemExit(f"ERROR: input not found: {p}")
 
-    content = p.read_text(encoding=args.encoding, errors="strict").strip()
-    if not content:
-        raise SystemExit("ERROR: input is empty after strip()")
+# Built once at import; main() may be called repeatedly by a driver.
+_PARSER = _build_parser()
 
-    e = LocalExecutor()
-
-    r_raw = e.execute_tool("artifact.ingest", {"created_at_utc": args.created_at_utc, "content": content})
-    raw_id = r_raw["artifact_id"]
-    print("RAW:", raw_id)
-
-    r_san = e.execute_tool("artifact.sanitize", {"created_at_utc": args.created_at_utc, "raw_artifact_id": raw_id})
-    san_id = r_san["artifact_id"]
-    print("SANITIZED:", san_id)
-
-    r_can = e.execute_tool("artifact.canon_select", {"created_at_utc": args.created_at_utc, "sanitized_artifact_id": san_id})
-    can_id = r_can["artifact_id"]
-    print("CANON:", can_id)
-
-    r_bun = e.execute_tool("artifact.bundle_manifest", {"created_at_utc": args.created_at_utc, "canon_artifact_id": can_id})
-    bun_id = r_bun["artifact_id"]
-    print("BUNDLE:", bun_id)
-
-    r_spec = e.execute_tool(
-        "artifact.build_spec",
-        {
-            "created_at_utc": args.created_at_utc,
-            "bundle_artifact_id": bun_id,
-            "provider": args.provider,
-            "model": args.model,
-            "temperature": args.temperature,
-            "max_tokens": args.max_tokens,
-        },
-    )
-    spec_id = r_spec["artifact_id"]
-    print("BUILD_SPEC:", spec_id)
 
-    r_wo = e.execute_tool("artifact.work_order_emit", {"created_at_utc": args.created_at_utc, "build_spec_artifact_id": spec_id})
-    wo_id = r_wo["artifact_id"]
-    print("WORK_ORDER:", wo_id)
+def main(argv: Optional[List[str]] = None) -> int:
+    # Intermixed: options may appear between input paths.
+    args = _PARSER.parse_intermixed_args(argv)
 
-    print("PIPELINE COMPLETE")
+    paths = _expand_inputs(args.input_path)
+    if not paths:
+        raise SystemExit(f"ERROR: no inputs matched: {' '.join(args.input_path)}")
+    contents = [_read_content(p, args.encoding) for p in paths]
+
+    # Output is collected per section and written once per section.
+    out: List[str] = []
+    if len(contents) == 1 and args.parallel is None:
+        run = build_runner(args.provider, args.model, args.temperature, args.max_tokens)
+        ids: List[Tuple[str, str]] = []
+        try:
+            run(contents[0], args.created_at_utc, ids)
+        except BaseException:
+            # A later stage failed: still report the artifacts the earlier stages created.
+            if ids:
+                _emit([f"{label}: {aid}" for label, aid in ids])
+            raise
+        out.extend(f"{label}: {aid}" for label, aid in ids)
+    else:
+        if args.parallel is not None:
+            batch = asyncio.run(run_parallel(contents, args, args.parallel))
+        else:
+            batch = run_batch(contents, args)
+        for p, ids in zip(paths, batch):
+            out.append(f"INPUT: {p}")
+            out.extend(f"{label}: {aid}" for label, aid in ids)
+    out.append("PIPELINE COMPLETE")
+    _emit(out)
 
     if args.registry_tail and args.registry_tail > 0:
         reg = Path(".adam_os/artifacts/artifact_registry.jsonl")
-        if reg.exists():
-            lines = reg.read_text(encoding="utf-8").splitlines()
-            n = int(args.registry_tail)
-            print("---- REGISTRY TAIL ----")
-            for line in lines[-n:]:
-                print(line)
-        else:
-            print("WARN: registry not found at .adam_os/artifacts/artifact_registry.jsonl")
+        try:
+            _emit(["---- REGISTRY TAIL ----", *tail_lines(reg, int(args.registry_tail))])
+        except FileNotFoundError:
+            _emit(["WARN: registry not found at .adam_os/artifacts/artifact_registry.jsonl"])
 
     return 0
 
@@ -11,7 +11,11 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT))
 
-from adam_os.execution_core.executor import LocalExecutor  # noqa: E402
+from _tail import tail_lines  # noqa: E402
+
+
+# Same output as json.dumps(o, indent=2, sort_keys=True), without building an encoder per call.
+_dumps = json.JSONEncoder(indent=2, sort_keys=True).encode
 
 
 def _nonempty(s: str | None, label: str) -> str:
@@ -20,14 +24,59 @@ def _nonempty(s: str | None, label: str) -> str:
     return str(s).strip()
 
 
-def main() -> int:
+def _is_snapshot_line(b: bytes) -> bool:
+    return b'"kind":"SNAPSHOT_' in b or b'"notes":"artifact.snapshot_export"' in b
+
+
+def _size_or_na(p: Path) -> int | str:
+    # One stat per file: size if present, "NA" if missing.
+    try:
+        return os.stat(p).st_size
+    except FileNotFoundError:
+        return "NA"
+
+
+def _emit(lines: list[str]) -> None:
+    # One write per output section instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_export(r: dict, verify: bool) -> None:
+    # Print deterministic keys (be tolerant of minor return-shape drift)
+    snapshot_id = r.get("artifact_id") or r.get("snapshot_id")
+    manifest_id = r.get("manifest_artifact_id") or r.get("manifest_id") or r.get("manifest")
+
+    out = [
+        f"SNAPSHOT_ARCHIVE: {snapshot_id}",
+        f"SNAPSHOT_MANIFEST: {manifest_id}",
+        "RAW_RETURN_JSON:",
+        _dumps(r),
+    ]
+
+    if verify:
+        snap_id = _nonempty(snapshot_id, "snapshot_id from tool return")
+        snap_dir = Path(".adam_os") / "artifacts" / "snapshots" / snap_id
+        enc_size = _size_or_na(snap_dir / "snapshot.enc")
+        man_size = _size_or_na(snap_dir / "snapshot_manifest.json")
+
+        out += [
+            "\nVERIFY_FILES:",
+            f"DIR: {snap_dir}",
+            f"ENC_EXISTS: {enc_size != 'NA'} SIZE: {enc_size}",
+            f"MAN_EXISTS: {man_size != 'NA'} SIZE: {man_size}",
+        ]
+    _emit(out)
+
+
+def _build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser(
         description="Snapshot Gate: snapshot an existing WORK_ORDER via artifact.snapshot_export (snapshot-only)."
     )
     ap.add_argument(
         "--work-order",
         required=True,
-        help="WORK_ORDER artifact_id to snapshot (e.g. ...--build_spec--work_order)",
+        action="append",
+        help="WORK_ORDER artifact_id to snapshot (e.g. ...--build_spec--work_order). Repeat for several.",
     )
     ap.add_argument(
         "--created-at-utc",
@@ -50,56 +99,52 @@ def main() -> int:
         default=80,
         help="Lines of registry to show during --verify (default: 80).",
     )
-    args = ap.parse_args()
+    return ap
 
-    work_order_id = _nonempty(args.work_order, "work_order")
-    created_at_utc = _nonempty(args.created_at_utc, "created_at_utc")
 
-    passphrase = (args.passphrase or os.environ.get("ADAMOS_SNAPSHOT_PASSPHRASE") or "").strip()
-    passphrase = _nonempty(passphrase, "encryption_passphrase (pass --passphrase or set ADAMOS_SNAPSHOT_PASSPHRASE)")
+# Built once at import; main() may be called repeatedly by a driver.
+_PARSER = _build_parser()
 
-    e = LocalExecutor()
-    r = e.execute_tool(
-        "artifact.snapshot_export",
-        {
-            "created_at_utc": created_at_utc,
-            "work_order_artifact_id": work_order_id,
-            "encryption_passphrase": passphrase,
-        },
-    )
 
-    # Print deterministic keys (be tolerant of minor return-shape drift)
-    snapshot_id = r.get("artifact_id") or r.get("snapshot_id")
-    manifest_id = r.get("manifest_artifact_id") or r.get("manifest_id") or r.get("manifest")
+def main(argv: list[str] | None = None) -> int:
+    args = _PARSER.parse_intermixed_args(argv)
 
-    print("SNAPSHOT_ARCHIVE:", snapshot_id)
-    print("SNAPSHOT_MANIFEST:", manifest_id)
-    print("RAW_RETURN_JSON:")
-    print(json.dumps(r, indent=2, sort_keys=True))
+    work_order_ids = [_nonempty(w, "work_order") for w in args.work_order]
+    created_at_utc = _nonempty(args.created_at_utc, "created_at_utc")
 
-    if args.verify:
-        snap_id = _nonempty(snapshot_id, "snapshot_id from tool return")
-        snap_dir = Path(".adam_os") / "artifacts" / "snapshots" / snap_id
-        enc_path = snap_dir / "snapshot.enc"
-        man_path = snap_dir / "snapshot_manifest.json"
+    passphrase = (args.passphrase or os.environ.get("ADAMOS_SNAPSHOT_PASSPHRASE") or "").strip()
+    passphrase = _nonempty(passphrase, "encryption_passphrase (pass --passphrase or set ADAMOS_SNAPSHOT_PASSPHRASE)")
 
-        print("\nVERIFY_FILES:")
-        print(f"DIR: {snap_dir}")
-        print(f"ENC_EXISTS: {enc_path.exists()} SIZE: {enc_path.stat().st_size if enc_path.exists() else 'NA'}")
-        print(f"MAN_EXISTS: {man_path.exists()} SIZE: {man_path.stat().st_size if man_path.exists() else 'NA'}")
+    # Deferred: the executor import pulls in every tool module, which --help
+    # and argument errors do not need.
+    from adam_os.execution_core.executor import get_executor
+
+    export = get_executor().bind(["artifact.snapshot_export"])["artifact.snapshot_export"]
+    # Exports run one at a time, in the order given: each archive tars
+    # .adam_os/artifacts, sibling snapshot dirs included, so concurrent
+    # exports would capture each other's in-progress files.
+    for work_order_id in work_order_ids:
+        r = export(
+            {
+                "created_at_utc": created_at_utc,
+                "work_order_artifact_id": work_order_id,
+                "encryption_passphrase": passphrase,
+            }
+        )
+        _print_export(r, args.verify)
 
+    if args.verify:
         reg = Path(".adam_os") / "artifacts" / "artifact_registry.jsonl"
-        print("\nVERIFY_REGISTRY_PATH:", reg)
-        if reg.exists():
-            tail_n = max(10, int(args.registry_tail))
-            lines = reg.read_text(encoding="utf-8").splitlines()
-            tail = lines[-tail_n:]
-            print(f"REGISTRY_TAIL_LAST_{tail_n}:")
-            for ln in tail:
-                if '"kind":"SNAPSHOT_' in ln or '"notes":"artifact.snapshot_export"' in ln:
-                    print(ln)
+        out = [f"\nVERIFY_REGISTRY_PATH: {reg}"]
+        tail_n = max(10, int(args.registry_tail))
+        try:
+            tail = tail_lines(reg, tail_n, predicate=_is_snapshot_line)
+        except FileNotFoundError:
+            out.append("WARN: registry not found at .adam_os/artifacts/artifact_registry.jsonl")
         else:
-            print("WARN: registry not found at .adam_os/artifacts/artifact_registry.jsonl")
+            out.append(f"REGISTRY_TAIL_LAST_{tail_n}:")
+            out += tail
+        _emit(out)
 
     return 0
 